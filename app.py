@@ -8,6 +8,14 @@ This allows Railway to deploy it as a web service.
 Endpoints:
 - GET /health - Health check
 - POST /process - Process a service (expects {"service_id": "recXXX"})
+
+Concurrency model: handlers stay plain sync functions on purpose.
+Deployment runs gevent workers (Procfile/Dockerfile), whose monkey-
+patched sockets already yield the worker during every Airtable/R2
+wait — the same benefit an async-def handler would buy, without
+forking the pyairtable/boto3 client stack onto aiohttp or mixing an
+asyncio event loop into gevent's. If the stack ever moves to ASGI,
+revisit this wholesale rather than per-handler.
 """
 
 import os
@@ -26,6 +34,25 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Process-wide InteriorProcessor. Built lazily on the first /process
+# rather than at import: construction needs live credentials plus
+# xelatex on PATH, and this module is imported by tests and
+# tooling that have neither. Reusing one instance keeps the pooled
+# Airtable session, record cache, and boto3 client warm across
+# requests instead of rebuilding them per request.
+_processor = None
+
+
+def _get_processor() -> InteriorProcessor:
+    global _processor
+    if _processor is None:
+        # Benign race under concurrent workers: InteriorProcessor
+        # construction is idempotent, so a rare double-build just
+        # discards one instance.
+        _processor = InteriorProcessor()
+    return _processor
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
@@ -71,9 +98,7 @@ def process():
         service_id = data['service_id']
         logger.info(f"Processing service: {service_id}")
 
-        # Initialize processor and process service
-        processor = InteriorProcessor()
-        result = processor.process_service(service_id)
+        result = _get_processor().process_service(service_id)
         
         if result['success']:
             return jsonify(result), 200
@@ -88,5 +113,8 @@ def process():
         }), 500
 
 if __name__ == '__main__':
+    # Local development only. Deployed containers run under gunicorn
+    # with gevent workers (see Procfile / Dockerfile CMD) — Werkzeug's
+    # dev server allows a single in-flight request.
     port = int(os.getenv('PORT', 8080))
     app.run(host='0.0.0.0', port=port)
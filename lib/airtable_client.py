@@ -9,49 +9,248 @@ Version: 1.1.0
 """
 
 import os
+import re
 import logging
-from typing import Dict, Any, Optional
-from pyairtable import Api
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from cachetools import TTLCache
+from pyairtable import Api, retry_strategy
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Airtable's OR(RECORD_ID()=...) formula approach degrades with very long
+# formulas; 10 ids per list call keeps the URL well under limits while
+# still collapsing a typical dependency fan-out into one round-trip.
+_BATCH_CHUNK_SIZE = 10
+
+# Fan-out for multi-chunk fetches. requests.Session is thread-safe for
+# reads and the GIL is released during socket I/O, so overlapping the
+# chunk round-trips turns sum-of-latencies into max-of-latencies.
+_FETCH_WORKERS = 8
+
+# Record cache sizing. 60s keeps repeat webhook bursts for the same
+# Service off the network without letting operator edits in Airtable
+# go stale for long. Not-found results are cached much more briefly —
+# a record may simply not exist *yet* (Zap ordering).
+_CACHE_MAXSIZE = 1024
+_CACHE_TTL_SECONDS = 60
+_NEGATIVE_CACHE_TTL_SECONDS = 10
+
+# Reference tables — Service Catalog, Projects, Book Metadata,
+# Imprints — change on editorial timescales, not per run, so they get
+# a 5-minute TTL. Services stays on the short TTL: its Status/URL
+# fields are the worker's coordination state.
+_REFERENCE_TABLES = frozenset(
+    ('Service Catalog', 'Projects', 'Book Metadata', 'Imprints')
+)
+_REFERENCE_TTL_SECONDS = 300
+
+# Airtable record IDs are "rec" + alphanumerics. IDs are interpolated
+# into OR(RECORD_ID()='...') formulas, and get_service receives its ID
+# verbatim from the webhook POST body — anything not matching this
+# shape is rejected before it can reach a formula string (a quote in
+# the "ID" would otherwise break or widen the query).
+_RECORD_ID_RE = re.compile(r'rec[A-Za-z0-9]+\Z')
+
 
 class AirtableClient:
     """Client for Airtable Services table."""
-    
+
     def __init__(self):
         """Initialize Airtable client."""
         self.token = os.getenv('AIRTABLE_TOKEN')
         self.base_id = os.getenv('AIRTABLE_BASE_ID')
         self.table_name = "Services"
-        
+
         if not self.token:
             raise ValueError("AIRTABLE_TOKEN environment variable not set")
         if not self.base_id:
             raise ValueError("AIRTABLE_BASE_ID environment variable not set")
-        
-        self.api = Api(self.token)
-        self.table = self.api.table(self.base_id, self.table_name)
-        
+
+        # One pooled, keep-alive session for every Airtable call this
+        # process makes: TLS handshakes happen once per pooled
+        # connection, not once per request. Transient failures (rate
+        # limit, gateway errors) retry with exponential backoff —
+        # Airtable PATCHes here are absolute field writes, so replaying
+        # one is safe. An httpx/HTTP2 client was considered and
+        # rejected: pyairtable is requests-based, and with batched
+        # fetches plus these caches the per-run request count is small
+        # enough that keep-alive reuse already removes the handshake
+        # cost HTTP/2 multiplexing would target.
+        retries = retry_strategy(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        )
+        self.api = Api(self.token, timeout=(5, 30), retry_strategy=retries)
+        self.api.session.mount('https://', HTTPAdapter(
+            pool_connections=10, pool_maxsize=20, max_retries=retries
+        ))
+        # Table handles are cached per table name — pyairtable Table
+        # objects were previously rebuilt on every get_* call.
+        self._tables: Dict[str, Any] = {}
+        self.table = self._table(self.table_name)
+
+        # Per-process record cache, keyed by (table, record_id). A hit
+        # is an O(1) dict lookup instead of a ~150ms HTTPS round-trip;
+        # the same Project/Book Metadata is commonly read several times
+        # within one /process and across quick successive webhooks.
+        self._record_cache: TTLCache = TTLCache(
+            maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS
+        )
+        self._reference_cache: TTLCache = TTLCache(
+            maxsize=_CACHE_MAXSIZE, ttl=_REFERENCE_TTL_SECONDS
+        )
+        self._negative_cache: TTLCache = TTLCache(
+            maxsize=_CACHE_MAXSIZE, ttl=_NEGATIVE_CACHE_TTL_SECONDS
+        )
+        # TTLCache is not thread-safe (its expiry bookkeeping mutates a
+        # linked list even on reads), and the worker overlaps Airtable
+        # walks on real threads (Step 3/4 pool in process_service). All
+        # cache access goes through this lock; the guarded sections are
+        # pure dict work, so contention is negligible next to the
+        # network calls they save.
+        self._cache_lock = threading.Lock()
+
         logger.info(f"Airtable client initialized: {self.base_id}/{self.table_name}")
-    
+
+    def _table(self, table_name: str):
+        """Get (and cache) the pyairtable Table handle for a table."""
+        handle = self._tables.get(table_name)
+        if handle is None:
+            handle = self.api.table(self.base_id, table_name)
+            self._tables[table_name] = handle
+        return handle
+
+    def get_records(self, table_name: str,
+                    ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Batch-fetch records by ID from one table.
+
+        Coalesces up to 10 record IDs per Airtable list call using an
+        OR(RECORD_ID()=...) formula, so N serial round-trips collapse
+        into ceil(N/10) — the dominant cost for this compute-light
+        worker is Airtable latency, not local work.
+
+        Args:
+            table_name: Airtable table name
+            ids: Record IDs to fetch (duplicates are collapsed)
+
+        Returns:
+            Dict mapping record ID to record fields. IDs that don't
+            exist (or fail to fetch) are simply absent.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        records: Dict[str, Dict[str, Any]] = {}
+        to_fetch: List[str] = []
+
+        cache = (self._reference_cache if table_name in _REFERENCE_TABLES
+                 else self._record_cache)
+
+        with self._cache_lock:
+            for record_id in unique_ids:
+                if not _RECORD_ID_RE.fullmatch(record_id or ''):
+                    # Not a plausible record ID — never let it near a
+                    # formula string (see _RECORD_ID_RE). Absent from
+                    # the result, same as a record that doesn't exist.
+                    logger.warning(
+                        f"Rejected malformed record ID for {table_name}: "
+                        f"{record_id!r}"
+                    )
+                    continue
+                key = (table_name, record_id)
+                cached = cache.get(key)
+                if cached is not None:
+                    records[record_id] = cached
+                elif key in self._negative_cache:
+                    # Recently confirmed missing — skip the round-trip.
+                    pass
+                else:
+                    to_fetch.append(record_id)
+
+        table = self._table(table_name)
+        chunks = [to_fetch[start:start + _BATCH_CHUNK_SIZE]
+                  for start in range(0, len(to_fetch), _BATCH_CHUNK_SIZE)]
+
+        # One chunk goes straight out; several overlap on a small
+        # thread pool so the wall cost is one round-trip, not N/10.
+        # Cache writes stay on the calling thread and happen under
+        # _cache_lock — the TTLCaches are not thread-safe, and this
+        # method itself runs concurrently on the worker's Step 3/4
+        # threads.
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_FETCH_WORKERS, len(chunks))
+            ) as executor:
+                fetched_chunks = list(executor.map(
+                    lambda chunk: self._fetch_chunk(table, table_name, chunk),
+                    chunks,
+                ))
+        else:
+            fetched_chunks = [self._fetch_chunk(table, table_name, chunk)
+                              for chunk in chunks]
+
+        with self._cache_lock:
+            for chunk, fetched in zip(chunks, fetched_chunks):
+                if fetched is None:
+                    # Fetch *errors* are not negative-cached — only records
+                    # Airtable positively reported absent.
+                    continue
+                for record in fetched:
+                    records[record['id']] = record['fields']
+                    cache[(table_name, record['id'])] = record['fields']
+                for record_id in chunk:
+                    if record_id not in records:
+                        self._negative_cache[(table_name, record_id)] = True
+
+        return records
+
+    def _fetch_chunk(self, table, table_name: str,
+                     chunk: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """One OR(RECORD_ID()=...) list call; None on fetch error."""
+        formula = "OR(" + ",".join(
+            f"RECORD_ID()='{record_id}'" for record_id in chunk
+        ) + ")"
+        try:
+            return table.all(formula=formula)
+        except Exception as e:
+            logger.error(
+                f"Failed to batch-fetch {len(chunk)} record(s) from "
+                f"{table_name}: {e}"
+            )
+            return None
+
+    def _get_record(self, table_name: str,
+                    record_id: str) -> Optional[Dict[str, Any]]:
+        """Single-record fetch, delegating to the batched path."""
+        return self.get_records(table_name, [record_id]).get(record_id)
+
     def get_service(self, service_id: str) -> Optional[Dict[str, Any]]:
         """
         Get Service record by ID.
-        
+
         Args:
             service_id: Airtable record ID
-            
+
         Returns:
             Service record fields or None if not found
         """
-        try:
-            record = self.table.get(service_id)
-            return record['fields']
-        except Exception as e:
-            logger.error(f"Failed to get service {service_id}: {e}")
-            return None
+        fields = self._get_record(self.table_name, service_id)
+        if fields is None:
+            logger.error(f"Failed to get service {service_id}")
+        return fields
     
+    def get_services(self, service_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch-fetch Service records by ID (see get_records)."""
+        return self.get_records(self.table_name, service_ids)
+
+    def get_service_types(self,
+                          service_type_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch-fetch Service Catalog records by ID (see get_records)."""
+        return self.get_records('Service Catalog', service_type_ids)
+
     def update_service(self, service_id: str, fields: Dict[str, Any],
                        typecast: bool = False) -> bool:
         """
@@ -71,11 +270,64 @@ class AirtableClient:
         """
         try:
             self.table.update(service_id, fields, typecast=typecast)
+            # The cached copy is now stale; drop it so the next read
+            # sees the PATCHed fields.
+            with self._cache_lock:
+                self._record_cache.pop((self.table_name, service_id), None)
             logger.info(f"Updated service {service_id}: {list(fields.keys())}")
             return True
         except Exception as e:
             logger.error(f"Failed to update service {service_id}: {e}")
             return False
+
+    def update_services(self, updates: List[tuple],
+                        typecast: bool = False) -> List[bool]:
+        """
+        Update several Service records in batched Airtable calls.
+
+        Coalesces up to 10 updates per batch_update round-trip — for
+        callers that would otherwise PATCH record-by-record, this
+        replaces N writes with ceil(N/10). The single-service worker
+        flow keeps its two temporally separated writes (the claim must
+        be visible while processing runs), so this is for multi-service
+        callers and future coalescing of end-of-run field groups.
+
+        Args:
+            updates: (service_id, fields) pairs
+            typecast: see update_service
+
+        Returns:
+            Per-update success flags, in input order (a failed batch
+            call marks its whole chunk failed).
+        """
+        results: List[bool] = []
+        for start in range(0, len(updates), _BATCH_CHUNK_SIZE):
+            chunk = updates[start:start + _BATCH_CHUNK_SIZE]
+            records = [{'id': service_id, 'fields': fields}
+                       for service_id, fields in chunk]
+            try:
+                self.table.batch_update(records, typecast=typecast)
+            except Exception as e:
+                logger.error(
+                    f"Failed to batch-update {len(chunk)} service(s): {e}"
+                )
+                results.extend([False] * len(chunk))
+                continue
+            for service_id, fields in chunk:
+                with self._cache_lock:
+                    self._record_cache.pop((self.table_name, service_id), None)
+                logger.info(
+                    f"Updated service {service_id}: {list(fields.keys())}"
+                )
+            results.extend([True] * len(chunk))
+        return results
+
+    def clear_cache(self):
+        """Clear the record caches. Useful for testing or hot-reloading."""
+        with self._cache_lock:
+            self._record_cache.clear()
+            self._reference_cache.clear()
+            self._negative_cache.clear()
     
     def get_service_type(self, service_type_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -87,13 +339,10 @@ class AirtableClient:
         Returns:
             Service Type record fields or None if not found
         """
-        try:
-            service_catalog_table = self.api.table(self.base_id, 'Service Catalog')
-            record = service_catalog_table.get(service_type_id)
-            return record['fields']
-        except Exception as e:
-            logger.error(f"Failed to get service type {service_type_id}: {e}")
-            return None
+        fields = self._get_record('Service Catalog', service_type_id)
+        if fields is None:
+            logger.error(f"Failed to get service type {service_type_id}")
+        return fields
     
     def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -105,13 +354,10 @@ class AirtableClient:
         Returns:
             Project record fields or None if not found
         """
-        try:
-            projects_table = self.api.table(self.base_id, 'Projects')
-            record = projects_table.get(project_id)
-            return record['fields']
-        except Exception as e:
-            logger.error(f"Failed to get project {project_id}: {e}")
-            return None
+        fields = self._get_record('Projects', project_id)
+        if fields is None:
+            logger.error(f"Failed to get project {project_id}")
+        return fields
     
     def get_book_metadata(self, metadata_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -123,30 +369,24 @@ class AirtableClient:
         Returns:
             Book Metadata record fields or None if not found
         """
-        try:
-            metadata_table = self.api.table(self.base_id, 'Book Metadata')
-            record = metadata_table.get(metadata_id)
-            return record['fields']
-        except Exception as e:
-            logger.error(f"Failed to get book metadata {metadata_id}: {e}")
-            return None
+        fields = self._get_record('Book Metadata', metadata_id)
+        if fields is None:
+            logger.error(f"Failed to get book metadata {metadata_id}")
+        return fields
 
     # --- E4 additions (2026-07-19): Imprints table readers -----------------
     def get_imprint(self, imprint_id: str) -> Optional[Dict[str, Any]]:
         """One Imprints row by record id (E4)."""
-        try:
-            t = self.api.table(self.base_id, 'Imprints')
-            return t.get(imprint_id)['fields']
-        except Exception as e:
-            logger.error(f"Failed to get imprint {imprint_id}: {e}")
-            return None
+        fields = self._get_record('Imprints', imprint_id)
+        if fields is None:
+            logger.error(f"Failed to get imprint {imprint_id}")
+        return fields
 
     def get_default_imprint(self) -> Optional[Dict[str, Any]]:
         """The single E4 Default row (Landfall Ink per governance §7).
         Seven-row table — a full scan is cheap and needs no formula."""
         try:
-            t = self.api.table(self.base_id, 'Imprints')
-            for rec in t.all():
+            for rec in self._table('Imprints').all():
                 if rec['fields'].get('E4 Default'):
                     return rec['fields']
         except Exception as e:
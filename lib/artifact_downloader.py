@@ -8,25 +8,48 @@ Author: Pronto Publishing
 Version: 1.0.0
 """
 
-import json
+import hashlib
 import logging
-import requests
-from typing import Dict, Any
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache for downloaded artifact bytes, revalidated with a
+# conditional GET per download. Safe because artifact keys are
+# content-versioned (services/recXXX/manuscript.v1.json) and the ETag
+# check catches a rewrite anyway — a hit costs a 304 plus a local read
+# instead of a multi-MB transfer.
+_DEFAULT_CACHE_DIR = Path("/tmp/worker_2/artifact_cache")
+
+# The cache persists across runs, so it needs a ceiling: least
+# recently used entries are evicted once cached bodies exceed this.
+_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
 
 class ArtifactDownloader:
-    """Downloads artifacts from R2."""
-    
-    def __init__(self, r2_client):
+    """Downloads artifacts from R2.
+
+    All transfers go through the shared ProntoR2Client, whose boto3
+    client keeps a persistent urllib3 connection pool — successive
+    artifact downloads reuse the same TLS connection instead of paying
+    a fresh TCP+TLS handshake each time.
+    """
+
+    def __init__(self, r2_client, cache_dir: Optional[Path] = None):
         """
         Initialize downloader.
-        
+
         Args:
             r2_client: R2Client instance (not used for public URLs, but kept for consistency)
+            cache_dir: Directory for the on-disk artifact cache
+                (defaults to /tmp/worker_2/artifact_cache)
         """
         self.r2_client = r2_client
+        self.cache_dir = Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR
     
     def download(self, artifact_url: str) -> Dict[str, Any]:
         """
@@ -51,13 +74,97 @@ class ArtifactDownloader:
             else:
                 key = artifact_url
             
-            # Download using R2 client with credentials
-            artifact_json = self.r2_client.download_json(key)
-            
+            # Download using R2 client with credentials, revalidating
+            # any cached copy with a conditional GET.
+            artifact_json = self._fetch(key)
+
             logger.info(f"Artifact downloaded: {len(artifact_json.get('content', {}).get('blocks', []))} blocks")
-            
+
             return artifact_json
-        
+
         except Exception as e:
             logger.error(f"Failed to download artifact: {e}")
             raise ValueError(f"Could not download artifact from {artifact_url}: {str(e)}")
+
+    def _fetch(self, key: str) -> Dict[str, Any]:
+        """Fetch artifact bytes, serving unchanged objects from the
+        on-disk cache. The R2 ETag from the last full download rides an
+        If-None-Match; a 304 means the cached bytes are still current
+        (retries and reprocessing of the same service skip the
+        transfer). Any cache I/O problem falls back to a plain fetch —
+        the cache is an optimization, never a dependency.
+        """
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        body_path = self.cache_dir / f"{digest}.json"
+        etag_path = self.cache_dir / f"{digest}.etag"
+
+        etag = None
+        try:
+            if body_path.exists() and etag_path.exists():
+                etag = etag_path.read_text(encoding='utf-8').strip() or None
+        except OSError as e:
+            logger.warning(f"Could not read artifact cache metadata: {e}")
+
+        body, new_etag = self.r2_client.download_bytes_conditional(key, etag=etag)
+
+        if body is None:
+            logger.info(f"Artifact unchanged; reading {key} from disk cache")
+            try:
+                body = body_path.read_bytes()
+                # Refresh mtime so eviction sees this entry as live.
+                os.utime(body_path)
+                return orjson.loads(body)
+            except OSError as e:
+                # The cache dir is shared across worker processes, so
+                # another process's eviction (or /tmp cleanup) can
+                # unlink the body between the ETag read and the 304.
+                # The 304 is useless without the bytes — refetch
+                # unconditionally rather than fail the run.
+                logger.warning(
+                    f"Cached artifact body for {key} unreadable ({e}); "
+                    f"refetching"
+                )
+                body, new_etag = self.r2_client.download_bytes_conditional(
+                    key, etag=None
+                )
+
+        if new_etag:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(body)
+                etag_path.write_text(new_etag, encoding='utf-8')
+                self._evict()
+            except OSError as e:
+                logger.warning(f"Could not cache artifact {key}: {e}")
+
+        return orjson.loads(body)
+
+    def _evict(self) -> None:
+        """Drop least-recently-used cache entries above _CACHE_MAX_BYTES.
+
+        mtime doubles as the recency signal (hits refresh it), so the
+        scan is one readdir plus a stat per entry. Runs only after a
+        full download writes new bytes — hits never pay for it.
+        """
+        try:
+            entries = sorted(
+                ((p, p.stat()) for p in self.cache_dir.glob("*.json")),
+                key=lambda e: e[1].st_mtime,
+            )
+        except OSError as e:
+            logger.warning(f"Could not scan artifact cache for eviction: {e}")
+            return
+
+        total = sum(stat.st_size for _, stat in entries)
+        for body_path, stat in entries:
+            if total <= _CACHE_MAX_BYTES:
+                break
+            try:
+                body_path.unlink(missing_ok=True)
+                body_path.with_suffix('.etag').unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not evict {body_path}: {e}")
+                continue
+            total -= stat.st_size
+            logger.info(f"Evicted cached artifact {body_path.name} "
+                        f"({stat.st_size} bytes)")
@@ -4,11 +4,12 @@ Version: 1.0.0
 Purpose: Load and cache artifact schemas for validation
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
+
 
 class ArtifactRegistryError(Exception):
     """Base exception for artifact registry errors"""
@@ -25,6 +26,18 @@ class SchemaLoadError(ArtifactRegistryError):
     pass
 
 
+def _version_key(version: str) -> tuple:
+    """Sort key for dotted schema versions ("1.0", "2.1", "10.0").
+
+    Numeric components compare as integers; a malformed component
+    sorts behind every well-formed version rather than raising.
+    """
+    try:
+        return (1,) + tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return (0, version)
+
+
 class ArtifactRegistry:
     """
     Registry for loading and caching artifact schemas.
@@ -48,6 +61,11 @@ class ArtifactRegistry:
         
         self.registry_path = Path(registry_path)
         self._schema_cache: Dict[tuple, dict] = {}
+        # Directory-scan cache for list_schemas, keyed by the
+        # artifact_type filter (None = all types). The registry
+        # directory doesn't change at runtime, so repeated validation
+        # shouldn't pay the iterdir/glob syscalls each call.
+        self._list_cache: Dict[Optional[str], Dict[str, list]] = {}
         
         if not self.registry_path.exists():
             raise ArtifactRegistryError(
@@ -86,11 +104,11 @@ class ArtifactRegistry:
                 f"Schema version: {schema_version}"
             )
         
-        # Load and parse schema
+        # Load and parse schema (orjson parses the raw bytes directly —
+        # no text decode pass, and a faster cold start on first miss)
         try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
-        except json.JSONDecodeError as e:
+            schema = orjson.loads(schema_path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise SchemaLoadError(
                 f"Failed to parse schema: {schema_path}\n"
                 f"Error: {e}"
@@ -115,6 +133,9 @@ class ArtifactRegistry:
         Returns:
             Dictionary mapping artifact types to lists of available versions
         """
+        if artifact_type in self._list_cache:
+            return self._list_cache[artifact_type]
+
         schemas = {}
         
         # Get all artifact type directories
@@ -143,7 +164,8 @@ class ArtifactRegistry:
             
             if versions:
                 schemas[artifact_name] = sorted(versions)
-        
+
+        self._list_cache[artifact_type] = schemas
         return schemas
     
     def get_latest_version(self, artifact_type: str) -> Optional[str]:
@@ -158,17 +180,19 @@ class ArtifactRegistry:
         """
         schemas = self.list_schemas(artifact_type)
         versions = schemas.get(artifact_type, [])
-        
+
         if not versions:
             return None
-        
-        # Simple string sort works for semantic versions
-        # (assumes proper formatting: "1.0", "1.1", "2.0", etc.)
-        return versions[-1]
+
+        # Compare numerically, not lexicographically: a string sort
+        # silently picks "9.0" over "10.0" the day a two-digit major
+        # appears, and the wrong schema would load without any error.
+        return max(versions, key=_version_key)
     
     def clear_cache(self):
         """Clear the schema cache. Useful for testing or hot-reloading."""
         self._schema_cache.clear()
+        self._list_cache.clear()
 
 
 # Singleton instance for convenience
@@ -4,19 +4,144 @@ Version: 1.0.0
 Purpose: Validate artifacts against their schemas
 """
 
+import hashlib
 import json
+import threading
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 try:
     import jsonschema
     from jsonschema import Draft7Validator, validators
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT7
 except ImportError:
     raise ImportError(
         "jsonschema is required for validation. Install with: pip install jsonschema"
     )
 
+# Optional fast-accept path: fastjsonschema compiles a schema to a
+# generated Python function (~15x over jsonschema on valid documents).
+# It stops at the first error, so it only handles the accept case —
+# rejections fall back to Draft7Validator for the full error list the
+# ArtifactValidationError contract requires.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 from .artifact_registry import get_schema, SchemaNotFoundError
 
+# Compiled-validator cache keyed by (artifact_type, schema_version).
+# Draft7Validator construction is O(schema size) and dominates the cost
+# of validating a typical artifact — build each validator once per
+# process instead of once per call. The lock serializes cache misses
+# only (the worker validates from concurrent gevent/thread contexts);
+# hits are plain dict reads.
+_validator_cache: Dict[tuple, Draft7Validator] = {}
+_validator_lock = threading.Lock()
+
+# Second-level cache keyed by canonical schema content. Two registry
+# entries (or a registry refresh) that parse to the same schema dict
+# share one compiled validator instead of re-running construction for
+# identical content.
+_schema_digest_cache: Dict[str, Draft7Validator] = {}
+
+# Shared $ref registry. Every schema loaded through _get_validator is
+# registered under its $id, so cross-schema references resolve through
+# one pre-populated in-memory store (a dict lookup) instead of jsonschema
+# falling back to retrieval per unresolved URI; internal
+# "#/definitions/..." fragments resolve against the anchored resource.
+# referencing.Registry is immutable — updates rebind the module global
+# under _validator_lock.
+_ref_registry = Registry()
+
+
+def _schema_digest(schema: Dict[str, Any]) -> str:
+    """Digest of the schema's canonical JSON serialization."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _get_validator(artifact_type: str, schema_version: str) -> Draft7Validator:
+    """Return the compiled validator for (artifact_type, schema_version).
+
+    On first use per key, loads the schema from the registry and
+    caches the constructed validator — every later call is a dict hit.
+    Registry schemas are versioned and reviewed in-repo, so they are
+    trusted: no Draft-7 meta-schema check is run here (for large
+    schemas that check dwarfs validator construction itself; a broken
+    schema still fails loudly the first time it validates anything).
+    Content-identical schemas under different keys resolve to the same
+    validator instance via the digest cache. May raise
+    SchemaNotFoundError.
+    """
+    key = (artifact_type, schema_version)
+    validator = _validator_cache.get(key)
+    if validator is None:
+        with _validator_lock:
+            validator = _validator_cache.get(key)
+            if validator is None:
+                schema = get_schema(artifact_type, schema_version)
+                digest = _schema_digest(schema)
+                validator = _schema_digest_cache.get(digest)
+                if validator is None:
+                    global _ref_registry
+                    schema_id = schema.get('$id')
+                    if schema_id:
+                        _ref_registry = _ref_registry.with_resource(
+                            schema_id,
+                            Resource.from_contents(
+                                schema, default_specification=DRAFT7
+                            ),
+                        )
+                    validator = Draft7Validator(
+                        schema, registry=_ref_registry
+                    )
+                    _schema_digest_cache[digest] = validator
+                _validator_cache[key] = validator
+    return validator
+
+
+# fastjsonschema-compiled validators, same keying. A value of None
+# means "don't retry": the library is absent or this schema didn't
+# compile (fastjsonschema supports a narrower draft subset).
+_fast_validator_cache: Dict[tuple, Optional[Any]] = {}
+
+
+def _get_fast_validator(artifact_type: str, schema_version: str):
+    """Return the fastjsonschema-compiled validator for the key, or
+    None when unavailable. May raise SchemaNotFoundError."""
+    if fastjsonschema is None:
+        return None
+    key = (artifact_type, schema_version)
+    if key in _fast_validator_cache:
+        return _fast_validator_cache[key]
+    with _validator_lock:
+        if key in _fast_validator_cache:
+            return _fast_validator_cache[key]
+        schema = get_schema(artifact_type, schema_version)
+        try:
+            compiled = fastjsonschema.compile(schema)
+        except Exception:
+            # Unsupported schema construct — permanently fall back to
+            # the jsonschema path for this key.
+            compiled = None
+        _fast_validator_cache[key] = compiled
+    return compiled
+
+
+def clear_validator_cache() -> None:
+    """Clear the compiled-validator cache. Useful for testing or
+    hot-reloading (mirrors ArtifactRegistry.clear_cache)."""
+    global _ref_registry
+    with _validator_lock:
+        _validator_cache.clear()
+        _fast_validator_cache.clear()
+        _schema_digest_cache.clear()
+        _ref_registry = Registry()
+
 
 class ArtifactValidationError(Exception):
     """
@@ -73,16 +198,21 @@ class ArtifactValidationError(Exception):
 def validate_artifact(
     artifact: Dict[str, Any],
     expected_artifact_type: Optional[str] = None,
-    expected_schema_version: Optional[str] = None
+    expected_schema_version: Optional[str] = None,
+    fail_fast: bool = False
 ) -> None:
     """
     Validate an artifact against its schema.
-    
+
     Args:
         artifact: Artifact dictionary to validate
         expected_artifact_type: Optional expected artifact type (validates artifact_type field)
         expected_schema_version: Optional expected schema version (validates schema_version field)
-    
+        fail_fast: Stop at the first schema violation instead of
+            collecting the full error list. For callers that only need
+            valid/invalid, this skips walking the remaining errors on a
+            deeply invalid artifact.
+
     Raises:
         ArtifactValidationError: If validation fails
         SchemaNotFoundError: If the schema doesn't exist
@@ -146,9 +276,20 @@ def validate_artifact(
             }]
         )
     
-    # Load schema
+    # Load schema and compile the validator (cached per type/version)
     try:
-        schema = get_schema(artifact_type, schema_version)
+        # Fast-accept: a valid artifact (the overwhelmingly common
+        # case) returns through the compiled function without ever
+        # touching the jsonschema interpreter. A rejection falls
+        # through to Draft7Validator below for the full error list.
+        fast_validator = _get_fast_validator(artifact_type, schema_version)
+        if fast_validator is not None:
+            try:
+                fast_validator(artifact)
+                return
+            except fastjsonschema.JsonSchemaException:
+                pass
+        validator = _get_validator(artifact_type, schema_version)
     except SchemaNotFoundError as e:
         raise ArtifactValidationError(
             artifact_type=artifact_type,
@@ -159,24 +300,33 @@ def validate_artifact(
                 "value": None
             }]
         )
-    
+
     # Validate against schema
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(artifact))
+    if fail_fast:
+        first_error = next(validator.iter_errors(artifact), None)
+        errors = [first_error] if first_error is not None else []
+    else:
+        errors = list(validator.iter_errors(artifact))
     
     if errors:
-        validation_errors = []
-        for error in errors:
-            # Build JSON path
-            path = ".".join(str(p) for p in error.path) if error.path else "root"
-            
-            validation_errors.append({
-                "path": path,
+        # Hot on deeply invalid artifacts (hundreds of errors feeding
+        # retry loops): map(str, ...) joins instead of generator
+        # expressions, no hasattr guard (ValidationError always carries
+        # .instance), and the join/str lookups bound to locals so each
+        # iteration skips the global and bound-method resolution. Empty
+        # paths join to "" and fall through to the documented defaults.
+        join = ".".join
+        _str = str
+        validation_errors = [
+            {
+                "path": join(map(_str, error.path)) or "root",
                 "message": error.message,
-                "value": error.instance if hasattr(error, 'instance') else None,
-                "schema_path": ".".join(str(p) for p in error.schema_path) if error.schema_path else None
-            })
-        
+                "value": error.instance,
+                "schema_path": join(map(_str, error.schema_path)) or None
+            }
+            for error in errors
+        ]
+
         raise ArtifactValidationError(
             artifact_type=artifact_type,
             schema_version=schema_version,
@@ -202,12 +352,38 @@ def validate_artifact_file(
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        artifact = json.load(f)
-    
+    # Bulk-read the bytes and let orjson parse them directly — stdlib
+    # json.load reads through the text layer and is several times
+    # slower on multi-MB manuscripts, where parse time is comparable
+    # to validation time. (orjson.JSONDecodeError subclasses
+    # json.JSONDecodeError, so the documented raise holds.)
+    with open(file_path, 'rb') as f:
+        artifact = orjson.loads(f.read())
+
     validate_artifact(artifact, expected_artifact_type, expected_schema_version)
 
 
+# Severity ranking shared by the warning filters below; hoisted so the
+# hot comprehension doesn't rebuild the dict per call.
+_SEVERITY_LEVELS = {"low": 0, "medium": 1, "high": 2}
+
+
+def iter_warnings(artifact: Dict[str, Any],
+                  max_severity: str = "medium"):
+    """
+    Lazily yield artifact warnings above a severity threshold.
+
+    Generator variant of check_warnings for callers that only iterate
+    (or only need the first hit) — no intermediate list is built for
+    warning-heavy artifacts.
+    """
+    lvl = _SEVERITY_LEVELS.get
+    threshold = lvl(max_severity, 1)
+    for w in artifact.get("analysis", {}).get("warnings", ()):
+        if lvl(w.get("severity", "low"), 0) > threshold:
+            yield w
+
+
 def check_warnings(artifact: Dict[str, Any], max_severity: str = "medium") -> List[Dict[str, Any]]:
     """
     Check artifact warnings and return those above a severity threshold.
@@ -226,14 +402,17 @@ def check_warnings(artifact: Dict[str, Any], max_severity: str = "medium") -> Li
             for warning in high_warnings:
                 print(f"  - {warning['code']}: {warning.get('message', 'No message')}")
     """
-    severity_levels = {"low": 0, "medium": 1, "high": 2}
-    threshold = severity_levels.get(max_severity, 1)
-    
+    # Local binding of the dict lookup keeps the per-element cost to
+    # two method calls; on artifacts with thousands of warnings the
+    # comprehension itself is the dominant cost here.
+    lvl = _SEVERITY_LEVELS.get
+    threshold = lvl(max_severity, 1)
+
     warnings = artifact.get("analysis", {}).get("warnings", [])
-    
+
     return [
         w for w in warnings
-        if severity_levels.get(w.get("severity", "low"), 0) > threshold
+        if lvl(w.get("severity", "low"), 0) > threshold
     ]
 
 
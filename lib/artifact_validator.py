@@ -10,17 +10,49 @@ Version: 4.2.1
 """
 
 import logging
+import os
+import time
 from typing import Dict, Any
 
 from .artifact_validate import (
     validate_artifact as _validate_artifact,
+    _get_validator,
     ArtifactValidationError,
 )
-from .artifact_registry import SchemaNotFoundError
+from .artifact_registry import SchemaNotFoundError, list_schemas
 
 logger = logging.getLogger(__name__)
 
 
+def _warm_validators() -> None:
+    """Eagerly compile a validator for every schema in the registry.
+
+    Lazily-compiled validators give the first request per schema a long
+    tail (schema parse + meta-check + construction). Warming at import
+    moves that cost to worker boot. Opt-in via PRONTO_WARM_VALIDATORS=1
+    so test runs and CLI tools don't pay for schemas they never touch.
+    """
+    for artifact_type, versions in list_schemas().items():
+        for version in versions:
+            started = time.perf_counter()
+            try:
+                _get_validator(artifact_type, version)
+            except Exception as e:
+                logger.warning(
+                    f"Could not warm validator for {artifact_type} "
+                    f"v{version}: {e}"
+                )
+                continue
+            logger.debug(
+                f"Warmed validator {artifact_type} v{version} in "
+                f"{(time.perf_counter() - started) * 1000:.1f}ms"
+            )
+
+
+if os.getenv('PRONTO_WARM_VALIDATORS') == '1':
+    _warm_validators()
+
+
 def validate_artifact(
     artifact: Dict[str, Any],
     artifact_type: str,
@@ -38,11 +70,15 @@ def validate_artifact(
         schema_version: Schema version (e.g., "1.0")
         
     Returns:
-        Dict with 'valid' (bool) and 'errors' (list) keys
+        Dict with 'valid' (bool) and 'errors' (list) keys. The caller
+        only gates on valid/invalid, so validation stops at the first
+        schema violation (fail_fast) — 'errors' carries at most that
+        one message rather than the exhaustive list.
     """
     try:
         # underlying validate_artifact returns None on success and raises on failure
-        _validate_artifact(artifact, artifact_type, schema_version)
+        _validate_artifact(artifact, artifact_type, schema_version,
+                           fail_fast=True)
         logger.info(f"Artifact validation passed: {artifact_type} v{schema_version}")
         return {"valid": True, "errors": []}
 
@@ -68,6 +68,12 @@ SPAN_MARKS = frozenset({
     "underline", "strikethrough", "superscript", "subscript",
 })
 
+# Shared read-only stand-in for absent list fields (spans,
+# classification_notes). `or []` in a per-block path allocates a fresh
+# throwaway list each time the field is missing; this tuple is one
+# object for the whole process. Callers only iterate it.
+_EMPTY: tuple = ()
+
 
 class BlocksToLatexConverter:
     """v3.0.0: v2.0-native, role-based dispatch."""
@@ -91,19 +97,23 @@ class BlocksToLatexConverter:
         "structural":      "_render_structural",
     }
 
-    # LaTeX special-char escapes. Order matters: backslash first.
-    _ESCAPES = [
-        ("\\", "\\textbackslash{}"),
-        ("&",  r"\&"),
-        ("%",  r"\%"),
-        ("$",  r"\$"),
-        ("#",  r"\#"),
-        ("_",  r"\_"),
-        ("{",  r"\{"),
-        ("}",  r"\}"),
-        ("~",  r"\textasciitilde{}"),
-        ("^",  r"\textasciicircum{}"),
-    ]
+    # LaTeX special-char escapes, compiled to a str.translate table so
+    # escaping is one linear pass over the text instead of ten
+    # sequential str.replace scans. translate substitutes every source
+    # character simultaneously, which also removes the old
+    # backslash-must-go-first ordering hazard.
+    _ESCAPE_TABLE = str.maketrans({
+        "\\": "\\textbackslash{}",
+        "&":  r"\&",
+        "%":  r"\%",
+        "$":  r"\$",
+        "#":  r"\#",
+        "_":  r"\_",
+        "{":  r"\{",
+        "}":  r"\}",
+        "~":  r"\textasciitilde{}",
+        "^":  r"\textasciicircum{}",
+    })
 
     def __init__(self):
         """Verify exhaustive role coverage."""
@@ -120,6 +130,13 @@ class BlocksToLatexConverter:
                 f"Converter has handlers for non-canonical roles: "
                 f"{sorted(extra)}. These will never be called."
             )
+        # Bind handlers once: convert() dispatches thousands of blocks
+        # per book, and a prebuilt role → bound-method dict saves a
+        # getattr per block on the hot path.
+        self._handlers = {
+            role: getattr(self, name)
+            for role, name in self.HANDLER_MAP.items()
+        }
 
     # -- Public API ----------------------------------------------------------
 
@@ -145,9 +162,20 @@ class BlocksToLatexConverter:
             f"(degraded={degraded_mode})"
         )
 
+        # Output segments carry their own trailing separator ("\n\n"
+        # after a rendered block, "\n" after an environment opener) and
+        # are joined once at the end — the previous pattern appended a
+        # "" sentinel after every block, doubling the list the join had
+        # to walk. The rendered bytes are unchanged.
         out: List[str] = []
         list_state = _ListState()
 
+        # The render context is loop-invariant — degraded_mode and
+        # params don't change mid-document — so build it once instead
+        # of allocating a fresh dict for every one of the thousands of
+        # blocks a novel dispatches. Handlers treat ctx as read-only.
+        ctx = {"degraded": degraded_mode, "params": params}
+
         for block in blocks:
             role = block.get("role")
             if role is None:
@@ -155,19 +183,18 @@ class BlocksToLatexConverter:
                 # reader catches missing role; if we're here, something's
                 # off — emit a comment and continue rather than crash.
                 logger.error(f"Block {block.get('id')} has no role")
-                out.append(f"% ERROR: block {block.get('id')} has no role")
+                out.append(f"% ERROR: block {block.get('id')} has no role\n")
                 continue
 
             # List-grouping: wrap consecutive list_item blocks.
             new_env = list_state.transition(block, role)
             if new_env.close_prev:
-                out.append(f"\\end{{{new_env.close_prev}}}")
-                out.append("")
+                out.append(f"\\end{{{new_env.close_prev}}}\n\n")
             if new_env.open_new:
-                out.append(f"\\begin{{{new_env.open_new}}}")
+                out.append(f"\\begin{{{new_env.open_new}}}\n")
 
-            handler_name = self.HANDLER_MAP.get(role)
-            if handler_name is None:
+            handler = self._handlers.get(role)
+            if handler is None:
                 # FAIL-SAFE DEFAULT (amendment spec §5.3). A role this
                 # converter doesn't know — a future schema addition —
                 # must never cost the reader content. Render the block's
@@ -180,24 +207,19 @@ class BlocksToLatexConverter:
                     f"default). A W2 update for this role is overdue."
                 )
                 fallback = self._render_spans(block)
-                out.append(f"% WARNING: unknown role {role} rendered as body text")
+                out.append(f"% WARNING: unknown role {role} rendered as body text\n")
                 if fallback:
-                    out.append(fallback)
-                    out.append("")
+                    out.append(f"{fallback}\n\n")
                 continue
-            handler = getattr(self, handler_name)
-            ctx = {"degraded": degraded_mode, "params": params}
             latex = handler(block, ctx)
             if latex:
-                out.append(latex)
-                out.append("")
+                out.append(f"{latex}\n\n")
 
         # Close any list still open at end-of-document.
         if list_state.open_env:
-            out.append(f"\\end{{{list_state.open_env}}}")
-            out.append("")
+            out.append(f"\\end{{{list_state.open_env}}}\n\n")
 
-        return "\n".join(out).rstrip() + "\n"
+        return "".join(out).rstrip() + "\n"
 
     # -- Span / text rendering ----------------------------------------------
 
@@ -219,34 +241,40 @@ class BlocksToLatexConverter:
             return "".join(parts)
         return self._escape(block.get("text", "") or "")
 
+    # Mark → LaTeX command opener; the matching "}" closers are counted
+    # at wrap time. Keys mirror SPAN_MARKS.
+    _MARK_COMMANDS = {
+        "italic":        "\\textit{",
+        "bold":          "\\textbf{",
+        "small_caps":    "\\textsc{",
+        "code":          "\\texttt{",
+        "underline":     "\\underline{",
+        "strikethrough": "\\sout{",
+        "superscript":   "\\textsuperscript{",
+        "subscript":     "\\textsubscript{",
+    }
+
     def _wrap_with_marks(self, escaped_text: str, marks: List[str]) -> str:
         """Wrap escaped text with the per-span marks. Marks not in the
         canonical vocabulary are dropped silently (the v1 reader already
         normalizes what it carries through; W1 v5.0 producer emits only
         canonical marks).
+
+        Openers and closers are collected and joined once around the
+        text — re-wrapping the whole string per mark copied the full
+        span K times for K marks. Nesting order is unchanged: the
+        first-listed mark stays innermost.
         """
         if not marks:
             return escaped_text
-        wrapped = escaped_text
-        for mark in marks:
-            if mark == "italic":
-                wrapped = f"\\textit{{{wrapped}}}"
-            elif mark == "bold":
-                wrapped = f"\\textbf{{{wrapped}}}"
-            elif mark == "small_caps":
-                wrapped = f"\\textsc{{{wrapped}}}"
-            elif mark == "code":
-                wrapped = f"\\texttt{{{wrapped}}}"
-            elif mark == "underline":
-                wrapped = f"\\underline{{{wrapped}}}"
-            elif mark == "strikethrough":
-                wrapped = f"\\sout{{{wrapped}}}"
-            elif mark == "superscript":
-                wrapped = f"\\textsuperscript{{{wrapped}}}"
-            elif mark == "subscript":
-                wrapped = f"\\textsubscript{{{wrapped}}}"
-            # else: unknown mark, drop silently.
-        return wrapped
+        openers = [
+            self._MARK_COMMANDS[mark]
+            for mark in reversed(marks)
+            if mark in self._MARK_COMMANDS
+        ]
+        if not openers:
+            return escaped_text
+        return "".join(openers) + escaped_text + "}" * len(openers)
 
     def _escape(self, text: str) -> str:
         """Escape every LaTeX special character. Applied at span
@@ -254,10 +282,7 @@ class BlocksToLatexConverter:
         """
         if not text:
             return ""
-        out = text
-        for ch, replacement in self._ESCAPES:
-            out = out.replace(ch, replacement)
-        return out
+        return text.translate(self._ESCAPE_TABLE)
 
     # -- Plain text helper (titles, headings without inline marks) ---------
 
@@ -301,7 +326,7 @@ class BlocksToLatexConverter:
         """Positional sub-role ("title" / "subtitle" / "author_or_byline")
         from C-003's classification_notes; "" when absent (v1
         synthesized title_page blocks)."""
-        for n in (block.get("classification_notes") or []):
+        for n in (block.get("classification_notes") or _EMPTY):
             if "positional role:" in n:
                 return n.split(":", 1)[-1].strip().lower()
         return ""
@@ -610,7 +635,7 @@ class BlocksToLatexConverter:
 
     def _render_body_paragraph(self, block: Dict[str, Any], ctx: Dict[str, Any]) -> str:
         raw = "".join(
-            s.get("text", "") for s in (block.get("spans") or [])
+            s.get("text", "") for s in (block.get("spans") or _EMPTY)
         )
         stripped = raw.strip()
         if stripped and self._ASTERISM_RE.match(stripped) and any(
@@ -761,6 +786,12 @@ class _ListEnvTransition:
         self.open_new = open_new
 
 
+# The no-change transition is by far the common case (every block
+# outside a list, every item continuing a list) — share one immutable
+# instance instead of allocating a fresh transition per block.
+_NO_TRANSITION = _ListEnvTransition()
+
+
 class _ListState:
     """Tracks the open list environment across consecutive list_item
     blocks. Wraps runs of list_item-role blocks in itemize / enumerate;
@@ -777,12 +808,12 @@ class _ListState:
                 close = self.open_env
                 self.open_env = None
                 return _ListEnvTransition(close_prev=close)
-            return _ListEnvTransition()
+            return _NO_TRANSITION
 
         # list_item block.
         wanted_env = "enumerate" if block.get("list_ordered") else "itemize"
         if self.open_env == wanted_env:
-            return _ListEnvTransition()  # already open in the right kind
+            return _NO_TRANSITION  # already open in the right kind
         if self.open_env is not None:
             # Switching kind — close the prior, open the new.
             close = self.open_env
@@ -1,46 +1,82 @@
 """
-PDF Generator - Pandoc + XeLaTeX
-=================================
+PDF Generator - XeLaTeX
+=======================
 
-Generates print-ready PDFs from LaTeX files using Pandoc and XeLaTeX.
+Generates print-ready PDFs from LaTeX files using XeLaTeX.
+
+BlocksToLatexConverter already emits a complete LaTeX document, so
+there is nothing for Pandoc to do on this path: driving XeLaTeX
+through it only added a subprocess plus a parse/AST step per run. The
+generator invokes XeLaTeX (via latexmk -pdfxe when available)
+directly and no longer requires Pandoc at all.
+
+A precompiled format file (xelatex -ini ... \\dump of the preamble) was
+evaluated to shave package-loading time off every run and rejected:
+the preamble is not fixed — there are fourteen of them, one per
+genre x trim template, each with its own geometry — and fontspec's
+OpenType font loading cannot be captured in a dumped format anyway, so
+the expensive part of startup would survive. Pass-count minimization
+(latexmk -pdfxe / the convergence loop in generate) is where that
+time is recovered instead.
 
 Author: Pronto Publishing
 Version: 1.0.0
 """
 
+import hashlib
+import os
 import subprocess
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Cap on simultaneous compiles per process. The gevent web workers
+# accept up to worker-connections requests each, and without a cap a
+# webhook burst would fork that many XeLaTeX subprocesses at once —
+# each CPU-bound and writing large aux/.xdv files into the shared
+# (and size-limited) work dir. Excess builds queue here; under gevent
+# the wait yields, so I/O-bound requests keep progressing. Raise via
+# WORKER2_MAX_BUILDS on containers with CPU and memory to spare.
+_MAX_CONCURRENT_BUILDS = int(os.environ.get('WORKER2_MAX_BUILDS', '2'))
+_build_semaphore = threading.BoundedSemaphore(_MAX_CONCURRENT_BUILDS)
+
 
 class PDFGenerator:
-    """Generates PDFs using Pandoc + XeLaTeX."""
-    
+    """Generates PDFs using XeLaTeX."""
+
+    # Rerun ceiling, latexmk-style. Pathological documents that never
+    # converge (page-number oscillation) still terminate.
+    MAX_PASSES = 4
+
     def __init__(self):
         """Initialize PDF generator."""
-        self.pandoc_cmd = "pandoc"
         self.xelatex_cmd = "xelatex"
-        
-        # Check if Pandoc is installed
-        try:
-            subprocess.run([self.pandoc_cmd, "--version"], 
-                         capture_output=True, check=True)
-            logger.info("Pandoc found")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.error("Pandoc not found - install with: apt-get install pandoc")
-            raise RuntimeError("Pandoc not installed")
-        
+
         # Check if XeLaTeX is installed
         try:
-            subprocess.run([self.xelatex_cmd, "--version"], 
+            subprocess.run([self.xelatex_cmd, "--version"],
                          capture_output=True, check=True)
             logger.info("XeLaTeX found")
         except (subprocess.CalledProcessError, FileNotFoundError):
             logger.error("XeLaTeX not found - install with: apt-get install texlive-xetex")
             raise RuntimeError("XeLaTeX not installed")
+
+        # Prefer latexmk when the image ships it: -pdfxe runs exactly
+        # the passes the document needs and goes .xdv → xdvipdfmx,
+        # which beats repeated direct-to-PDF XeLaTeX on graphics-heavy
+        # books. Absent latexmk, generate() falls back to the in-process
+        # convergence loop below.
+        self.latexmk_cmd: Optional[str] = "latexmk"
+        try:
+            subprocess.run([self.latexmk_cmd, "--version"],
+                           capture_output=True, check=True)
+            logger.info("latexmk found")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            logger.info("latexmk not found; using built-in rerun logic")
+            self.latexmk_cmd = None
     
     def generate(
         self,
@@ -70,12 +106,85 @@ class PDFGenerator:
         if pdf_file.exists():
             pdf_file.unlink()
 
-        # Run XeLaTeX directly (Pandoc not needed for .tex → .pdf)
-        # We need to run XeLaTeX twice for proper page numbers and TOC
+        # Run XeLaTeX directly on the converter's .tex output.
+        # With latexmk available, -pdfxe picks the minimal pass count
+        # itself and finishes through xdvipdfmx; otherwise the fallback
+        # loop below reruns while the auxiliary files keep changing,
+        # up to MAX_PASSES. Either way a document with no
+        # cross-references or TOC compiles once (LaTeX is
+        # single-threaded and dominates run cost), and heavily
+        # cross-referenced books get a third pass when two genuinely
+        # aren't enough.
+        with _build_semaphore:
+            if self.latexmk_cmd:
+                self._run_latexmk(latex_file, output_dir, run_id, pdf_file)
+            else:
+                self._run_xelatex_converging(latex_file, output_dir, run_id,
+                                             pdf_file)
+
+        # Check if PDF was created
+        if not pdf_file.exists():
+            raise RuntimeError(f"PDF not created: {pdf_file}")
+        
+        logger.info(f"PDF generated: {pdf_file} ({pdf_file.stat().st_size} bytes)")
+        
+        # Clean up auxiliary files
+        self._cleanup_aux_files(output_dir, run_id)
+        
+        return pdf_file
+    
+    def _run_latexmk(self, latex_file: Path, output_dir: Path,
+                     run_id: str, pdf_file: Path) -> None:
+        """Compile once via latexmk -pdfxe (it handles reruns itself)."""
+        logger.info("Compiling with latexmk -pdfxe")
+
+        result = subprocess.run(
+            [
+                self.latexmk_cmd,
+                "-pdfxe",
+                "-interaction=nonstopmode",
+                f"-output-directory={Path(output_dir).resolve().as_posix()}",
+                f"-jobname={run_id}",
+                Path(latex_file).resolve().as_posix(),
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=str(output_dir)
+        )
+
+        pdf_exists = pdf_file.exists() and pdf_file.stat().st_size > 0
+
+        if not pdf_exists:
+            logger.error("latexmk failed: no PDF produced")
+            logger.error(result.stdout)
+            logger.error(result.stderr)
+            log_tail = self._read_log_tail(
+                output_dir / f"{run_id}.log", max_lines=50
+            )
+            detail = log_tail or result.stderr or result.stdout or "<no output>"
+            raise RuntimeError(
+                f"XeLaTeX compilation failed (latexmk): no PDF produced\n{detail}"
+            )
+
+        if result.returncode != 0:
+            logger.info(
+                f"latexmk exited {result.returncode} but produced a PDF; treating as success"
+            )
+        else:
+            logger.info("latexmk completed")
+
+    def _run_xelatex_converging(self, latex_file: Path, output_dir: Path,
+                                run_id: str, pdf_file: Path) -> None:
+        """Run XeLaTeX until the auxiliary files stop changing."""
+        aux_file = output_dir / f"{run_id}.aux"
+        toc_file = output_dir / f"{run_id}.toc"
+        prev_digest = None
+
+        for run_num in range(1, self.MAX_PASSES + 1):
+            logger.info(f"Running XeLaTeX (pass {run_num})")
 
-        for run_num in [1, 2]:
-            logger.info(f"Running XeLaTeX (pass {run_num}/2)")
-            
             # Paths are resolved to absolute POSIX form: a relative
             # Windows path is wrong once cwd=output_dir, and TeX parses
             # backslash path separators as control sequences (".\v12"
@@ -95,7 +204,7 @@ class PDFGenerator:
                 errors="replace",
                 cwd=str(output_dir)
             )
-            
+
             pdf_exists = pdf_file.exists() and pdf_file.stat().st_size > 0
 
             if not pdf_exists:
@@ -116,26 +225,56 @@ class PDFGenerator:
                 )
             else:
                 logger.info(f"XeLaTeX pass {run_num} completed")
-        
-        # Check if PDF was created
-        if not pdf_file.exists():
-            raise RuntimeError(f"PDF not created: {pdf_file}")
-        
-        logger.info(f"PDF generated: {pdf_file} ({pdf_file.stat().st_size} bytes)")
-        
-        # Clean up auxiliary files
-        self._cleanup_aux_files(output_dir, run_id)
-        
-        return pdf_file
-    
+
+            if run_num == 1 and self._aux_is_trivial(aux_file) \
+                    and not toc_file.exists():
+                # Nothing in the .aux for a second pass to resolve.
+                logger.info("No cross-references or TOC; one pass sufficient")
+                break
+
+            digest = self._aux_digest(aux_file, toc_file)
+            if digest == prev_digest:
+                logger.info(f"Auxiliary files converged after pass {run_num}")
+                break
+            prev_digest = digest
+        else:
+            logger.warning(
+                f"Auxiliary files still changing after {self.MAX_PASSES} "
+                f"passes; proceeding with the last PDF"
+            )
+
+    @staticmethod
+    def _aux_is_trivial(aux_file: Path) -> bool:
+        """True if the .aux holds no labels, TOC lines or outlines —
+        i.e. pass 1's PDF is already final."""
+        try:
+            lines = aux_file.read_text(
+                encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return False
+        return all(line.strip() in ("", "\\relax") for line in lines)
+
+    @staticmethod
+    def _aux_digest(aux_file: Path, toc_file: Path) -> str:
+        """Fingerprint of the rerun-relevant auxiliary files."""
+        digest = hashlib.sha256()
+        for path in (aux_file, toc_file):
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                digest.update(b"<absent>")
+        return digest.hexdigest()
+
     def _cleanup_aux_files(self, output_dir: Path, run_id: str):
         """Clean up LaTeX auxiliary files."""
-        aux_extensions = ['.aux', '.log', '.out', '.toc']
+        # One readdir instead of a stat per extension; missing_ok
+        # covers the file disappearing between glob and unlink.
+        aux_extensions = {'.aux', '.log', '.out', '.toc',
+                          '.fls', '.fdb_latexmk', '.xdv'}
 
-        for ext in aux_extensions:
-            aux_file = output_dir / f"{run_id}{ext}"
-            if aux_file.exists():
-                aux_file.unlink()
+        for aux_file in output_dir.glob(f"{run_id}.*"):
+            if aux_file.suffix in aux_extensions:
+                aux_file.unlink(missing_ok=True)
                 logger.debug(f"Cleaned up: {aux_file}")
 
     @staticmethod
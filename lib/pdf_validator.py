@@ -15,11 +15,20 @@ Author: Pronto Publishing
 Version: 1.0.0
 """
 
+import re
 import subprocess
 import logging
 from pathlib import Path
 from typing import Dict, Any
 
+# In-process metadata reads. pypdf is a declared dependency (QA review
+# already parses PDFs with it), but validation must not hard-fail on an
+# image without it — the pdfinfo subprocess path stays as fallback.
+try:
+    from pypdf import PdfReader
+except ImportError:  # pragma: no cover - pypdf is in requirements.txt
+    PdfReader = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +40,43 @@ class PDFValidator:
         self.max_file_size_mb = 500  # KDP limit is 650MB, use 500MB as safe limit
         self.min_pages = 24  # Minimum for most POD services
         self.max_pages = 828  # KDP limit
-    
+        # One pdfinfo run answers every metadata question validate()
+        # asks, so its parsed output is cached per (path, mtime) —
+        # page count and PDF version used to each fork their own
+        # subprocess against the same file.
+        self._pdfinfo_cache: Dict[tuple, Dict[str, str]] = {}
+
+    def _pdfinfo(self, pdf_file: Path) -> Dict[str, str]:
+        """Run pdfinfo once and return its output as a field dict."""
+        cache_key = (pdf_file, pdf_file.stat().st_mtime_ns)
+        cached = self._pdfinfo_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = subprocess.run(
+                ["pdfinfo", str(pdf_file)],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"pdfinfo failed: {e.stderr}")
+            raise
+        except FileNotFoundError:
+            logger.error("pdfinfo not found - install with: apt-get install poppler-utils")
+            raise RuntimeError("pdfinfo not installed")
+
+        fields = {
+            key.strip(): value.strip()
+            for key, value in (
+                line.split(':', 1)
+                for line in result.stdout.split('\n') if ':' in line
+            )
+        }
+        self._pdfinfo_cache[cache_key] = fields
+        return fields
+
     def validate(self, pdf_file: Path) -> Dict[str, Any]:
         """
         Validate PDF file.
@@ -108,44 +153,38 @@ class PDFValidator:
         return result
     
     def _get_page_count(self, pdf_file: Path) -> int:
-        """Get page count using pdfinfo."""
-        try:
-            result = subprocess.run(
-                ["pdfinfo", str(pdf_file)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            for line in result.stdout.split('\n'):
-                if line.startswith('Pages:'):
-                    return int(line.split(':')[1].strip())
-            
+        """Get page count — in-process via pypdf, pdfinfo as fallback.
+
+        Avoiding the fork/exec per validation matters on small PDFs
+        where subprocess startup dominates the actual metadata read.
+        """
+        if PdfReader is not None:
+            try:
+                return PdfReader(str(pdf_file), strict=False).get_num_pages()
+            except Exception as e:
+                logger.warning(
+                    f"pypdf page count failed, falling back to pdfinfo: {e}"
+                )
+        pages = self._pdfinfo(pdf_file).get('Pages')
+        if pages is None:
             raise ValueError("Pages field not found in pdfinfo output")
-        
-        except subprocess.CalledProcessError as e:
-            logger.error(f"pdfinfo failed: {e.stderr}")
-            raise
-        except FileNotFoundError:
-            logger.error("pdfinfo not found - install with: apt-get install poppler-utils")
-            raise RuntimeError("pdfinfo not installed")
-    
+        return int(pages)
+
     def _get_pdf_version(self, pdf_file: Path) -> str:
-        """Get PDF version using pdfinfo."""
+        """Get PDF version from the file header.
+
+        The version lives in the first bytes of the file ("%PDF-1.7");
+        parsing the whole document to learn it is disproportionate, so
+        this is a 16-byte read. Note XeLaTeX stamps the header version
+        only — a /Version override in the catalog (which nothing in our
+        toolchain writes) would not be seen here.
+        """
         try:
-            result = subprocess.run(
-                ["pdfinfo", str(pdf_file)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            for line in result.stdout.split('\n'):
-                if line.startswith('PDF version:'):
-                    return line.split(':')[1].strip()
-            
-            return "unknown"
-        
-        except Exception as e:
+            with pdf_file.open('rb') as f:
+                header = f.read(16)
+        except OSError as e:
             logger.warning(f"Failed to get PDF version: {e}")
             return "unknown"
+
+        match = re.match(rb'%PDF-(\d+\.\d+)', header)
+        return match.group(1).decode('ascii') if match else "unknown"
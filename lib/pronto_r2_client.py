@@ -13,17 +13,96 @@ Author: Pronto Publishing
 Version: 4.0.0
 """
 
-import json
 import hashlib
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+import threading
+
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
+from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Concurrent-upload fan-out. Stays under the widened connection pool
+# (max_pool_connections=32) so threads never block waiting for a socket.
+_UPLOAD_WORKERS = 8
+
+# Managed-transfer tuning for file uploads: above 8 MB boto3 switches
+# to multipart and pushes 8 MB parts on its own worker threads, so a
+# large interior PDF streams out in parallel chunks instead of one
+# long serial PUT. Below the threshold it's a single put_object.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+# boto3 clients are expensive to build (botocore parses its service
+# model JSON and spins up a fresh connection pool — ~100-300ms cold)
+# and thread-safe to share, so they're cached per endpoint+key across
+# ProntoR2Client instances. Shared keep-alive connections also mean
+# the TLS handshake isn't re-paid when a client is re-created.
+_client_cache: Dict[tuple, Any] = {}
+_client_lock = threading.Lock()
+
+
+def _get_s3_client(endpoint_url: str, access_key_id: str,
+                   secret_access_key: str):
+    """Get (and cache) the boto3 S3 client for an endpoint/key pair."""
+    cache_key = (endpoint_url, access_key_id)
+    with _client_lock:
+        client = _client_cache.get(cache_key)
+        if client is None:
+            # R2 access is authenticated S3 (sigv4 via botocore), which
+            # speaks HTTP/1.1 only — so instead of HTTP/2 multiplexing,
+            # concurrent transfers get a widened keep-alive pool
+            # (botocore's default is 10); each pooled connection pays
+            # its TLS handshake once. Adaptive retries back off under
+            # R2 throttling instead of hammering.
+            client = boto3.client(
+                's3',
+                endpoint_url=endpoint_url,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                config=Config(
+                    signature_version='s3v4',
+                    max_pool_connections=32,
+                    tcp_keepalive=True,
+                    retries={'max_attempts': 3, 'mode': 'adaptive'},
+                ),
+                region_name='auto'
+            )
+            _client_cache[cache_key] = client
+    return client
+
+
+@dataclass(frozen=True)
+class CanonicalArtifact:
+    """An artifact dict alongside its canonical bytes and hash.
+
+    Canonical serialization (sorted keys, minimal separators) is the
+    single most expensive CPU step of uploading a large artifact, and
+    callers that validate, hash and upload the same dict would each
+    redo it. Build this once with from_dict and pass it to upload_json,
+    which then reuses the bytes and hash instead of re-serializing.
+    """
+    raw: Dict[str, Any]
+    canon_bytes: bytes
+    sha256: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CanonicalArtifact":
+        canon_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.sha256(canon_bytes).hexdigest()
+        return cls(raw=data, canon_bytes=canon_bytes,
+                   sha256=f"sha256:{digest}")
+
 
 class ProntoR2Client:
     """Client for Cloudflare R2 storage operations."""
@@ -53,14 +132,10 @@ class ProntoR2Client:
         # API endpoint (for uploads/downloads)
         self.endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
         
-        # S3-compatible client
-        self.s3_client = boto3.client(
-            's3',
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            config=Config(signature_version='s3v4'),
-            region_name='auto'
+        # S3-compatible client, shared across instances for this
+        # endpoint/key pair (see _get_s3_client).
+        self.s3_client = _get_s3_client(
+            self.endpoint_url, access_key_id, secret_access_key
         )
         
         logger.info(f"R2 client initialized: bucket={bucket_name}, public={bool(public_base_url)}")
@@ -68,25 +143,34 @@ class ProntoR2Client:
     def upload_json(
         self,
         object_key: str,
-        data: Dict[str, Any],
+        data: Union[Dict[str, Any], CanonicalArtifact],
         content_type: str = 'application/json'
     ) -> Dict[str, str]:
         """
         Upload JSON data to R2.
-        
+
         Args:
             object_key: Object key in R2 (e.g., "services/recXXX/manuscript.v1.json")
-            data: JSON-serializable data
+            data: JSON-serializable data, or a pre-canonicalized
+                CanonicalArtifact whose bytes/hash are reused as-is
             content_type: MIME type
             
         Returns:
             Dict with 'public_url' and 'artifact_hash'
         """
-        # Serialize JSON (canonical format for hashing)
-        json_bytes = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
-        
-        # Compute artifact hash
-        artifact_hash = self._compute_hash(json_bytes)
+        # Serialize JSON (canonical format for hashing). orjson emits
+        # sorted-key, minimal-separator bytes directly — no intermediate
+        # str and no pure-Python serialize pass on multi-MB artifacts.
+        # Output is UTF-8 rather than ASCII-escaped; the artifact hash
+        # is computed over the uploaded bytes, so it stays
+        # self-consistent with what lands in R2. A caller that already
+        # canonicalized (CanonicalArtifact) skips both steps.
+        if isinstance(data, CanonicalArtifact):
+            json_bytes = data.canon_bytes
+            artifact_hash = data.sha256
+        else:
+            json_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+            artifact_hash = self._compute_hash(json_bytes)
         
         # Upload to R2
         self.s3_client.put_object(
@@ -94,10 +178,9 @@ class ProntoR2Client:
             Key=object_key,
             Body=json_bytes,
             ContentType=content_type,
-            Metadata={
-                'artifact_hash': artifact_hash,
-                'uploaded_at': datetime.utcnow().isoformat()
-            }
+            # Upload time is not duplicated into metadata — R2 already
+            # records it as LastModified; artifact_hash is the lineage key.
+            Metadata={'artifact_hash': artifact_hash}
         )
         
         # Generate public URL
@@ -129,36 +212,76 @@ class ProntoR2Client:
         Returns:
             Dict with 'public_url' and 'file_hash'
         """
+        # Hash and upload from the open handle — the file is never
+        # materialized in memory, so peak RSS stays at the 64 KiB read
+        # buffer instead of O(file size) for large print-ready PDFs.
+        # file_digest streams through OpenSSL's SHA-256 fast path with
+        # the GIL released.
         with open(file_path, 'rb') as f:
-            file_bytes = f.read()
-        
-        # Compute file hash
-        file_hash = self._compute_hash(file_bytes)
-        
-        # Upload to R2
-        self.s3_client.put_object(
-            Bucket=self.bucket_name,
-            Key=object_key,
-            Body=file_bytes,
-            ContentType=content_type or 'application/octet-stream',
-            Metadata={
-                'file_hash': file_hash,
-                'uploaded_at': datetime.utcnow().isoformat()
-            }
-        )
-        
+            file_hash = f"sha256:{hashlib.file_digest(f, 'sha256').hexdigest()}"
+            size_bytes = f.tell()
+            f.seek(0)
+
+            # Managed transfer streams the handle: multipart with
+            # parallel 8 MB parts above the threshold, single PUT
+            # below (see _TRANSFER_CONFIG).
+            self.s3_client.upload_fileobj(
+                f,
+                self.bucket_name,
+                object_key,
+                ExtraArgs={
+                    'ContentType': content_type or 'application/octet-stream',
+                    # LastModified covers upload time (see upload_json).
+                    'Metadata': {'file_hash': file_hash},
+                },
+                Config=_TRANSFER_CONFIG,
+            )
+
         # Generate public URL
         public_url = self._get_public_url(object_key)
-        
-        logger.info(f"Uploaded {object_key} ({len(file_bytes)} bytes, hash={file_hash[:16]}...)")
-        
+
+        logger.info(f"Uploaded {object_key} ({size_bytes} bytes, hash={file_hash[:16]}...)")
+
         return {
             'public_url': public_url,
             'file_hash': file_hash,
             'object_key': object_key,
-            'size_bytes': len(file_bytes)
+            'size_bytes': size_bytes
         }
     
+    def upload_many(self, items: List[tuple]) -> Dict[str, Dict[str, str]]:
+        """
+        Upload several objects concurrently.
+
+        Each put_object is a synchronous round-trip, so serial uploads
+        of a run's artifacts (JSON manifest + PDF) pay additive
+        latency. boto3 clients are thread-safe and the GIL is released
+        during socket I/O, so a small thread pool overlaps the
+        transfers — wall-clock drops from the sum to the max.
+
+        Args:
+            items: (object_key, payload, content_type) tuples. A dict
+                payload goes through upload_json; a str/Path payload is
+                treated as a local file path and goes through
+                upload_file.
+
+        Returns:
+            Dict mapping object_key to that upload's result dict.
+            The first failed upload re-raises.
+        """
+        def _upload(item):
+            object_key, payload, content_type = item
+            if isinstance(payload, dict):
+                return self.upload_json(object_key, payload,
+                                        content_type=content_type)
+            return self.upload_file(object_key, str(payload),
+                                    content_type=content_type)
+
+        with ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS) as executor:
+            results = list(executor.map(_upload, items))
+
+        return {result['object_key']: result for result in results}
+
     def download_json(self, object_key: str) -> Dict[str, Any]:
         """
         Download JSON data from R2.
@@ -175,7 +298,9 @@ class ProntoR2Client:
         )
         
         json_bytes = response['Body'].read()
-        data = json.loads(json_bytes.decode('utf-8'))
+        # orjson parses straight from bytes — no intermediate full-document
+        # str copy, and 2-5x faster than stdlib json on multi-MB manuscripts.
+        data = orjson.loads(json_bytes)
         
         logger.info(f"Downloaded {object_key} ({len(json_bytes)} bytes)")
         
@@ -227,6 +352,40 @@ class ProntoR2Client:
         """Compute SHA-256 hash of data."""
         return f"sha256:{hashlib.sha256(data).hexdigest()}"
 
+    def download_bytes_conditional(
+        self,
+        object_key: str,
+        etag: Optional[str] = None
+    ) -> tuple:
+        """
+        Download object bytes, revalidating against a cached ETag.
+
+        Args:
+            object_key: Object key in R2
+            etag: ETag from a previous download of this object, if any
+
+        Returns:
+            (body, etag) tuple. body is None when R2 answered
+            304 Not Modified for the supplied etag — the caller's
+            cached copy is still current and no body was transferred.
+        """
+        kwargs = {'Bucket': self.bucket_name, 'Key': object_key}
+        if etag:
+            kwargs['IfNoneMatch'] = etag
+
+        try:
+            response = self.s3_client.get_object(**kwargs)
+        except ClientError as e:
+            status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            if etag and status == 304:
+                logger.info(f"{object_key} not modified (ETag {etag})")
+                return None, etag
+            raise
+
+        body = response['Body'].read()
+        logger.info(f"Downloaded {object_key} ({len(body)} bytes)")
+        return body, response.get('ETag')
+
     # --- E3 addition (2026-07-20): raw bytes download (figure media) ------
     def download_bytes(self, object_key: str) -> bytes:
         """Download raw object bytes."""
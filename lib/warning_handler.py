@@ -23,11 +23,51 @@ Version: 1.0.1 (v2.0-tolerant; production unblock 2026-04-25)
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Processing-policy rule tables, frozen at import. Every
+# WarningHandler shares these read-only views — nothing rebuilds them
+# per instance, and accidental mutation (a batch runner poking
+# handler.fail_rules) raises instead of silently diverging from
+# PROCESSING_POLICY.md.
+
+# FAIL rules: Cannot process at all
+_FAIL_RULES = MappingProxyType({
+    'DETECTED_IMAGES': 'Images not supported in MVP',
+    'DETECTED_TABLES': 'Tables not supported in MVP',
+})
+
+# DEGRADE rules: Can process with fallback rendering
+_DEGRADE_RULES = MappingProxyType({
+    'DETECTED_FOOTNOTES': 'Footnotes rendered inline',
+    'POEM_LIKE_BLOCKS': 'Poetry rendered as blockquotes',
+    'UNICODE_RISK': 'Non-standard characters may render incorrectly',
+    'EXCESSIVE_WHITESPACE': 'Extra spacing normalized',
+    'CENTERED_TEXT_BLOCKS': 'Centered text rendered left-aligned',
+    'OCR_ARTIFACTS': 'OCR errors may affect quality',
+    'FORMATTING_INCONSISTENCY': 'Inconsistent formatting normalized',
+})
+
+# PROCEED rules: Can process normally (just log)
+_PROCEED_RULES = MappingProxyType({
+    'LOW_CHAPTER_CONFIDENCE': 'Chapter detection uncertain but proceeding',
+})
+
+# Merged dispatch table: one dict probe classifies a warning into its
+# bucket (see WarningHandler.evaluate). This also subsumes a separate
+# "known codes" frozenset for unknown-warning detection — the .get
+# miss IS the membership test, same single hash probe, without a
+# second structure to keep in sync with the three rule maps.
+_RULE_TABLE = MappingProxyType(
+    {code: ('FAIL', msg) for code, msg in _FAIL_RULES.items()}
+    | {code: ('DEGRADE', msg) for code, msg in _DEGRADE_RULES.items()}
+    | {code: ('PROCEED', msg) for code, msg in _PROCEED_RULES.items()}
+)
+
 
 def _warning_code(warning: Dict[str, Any]) -> Optional[str]:
     """Extract a warning's identifier across schema versions.
@@ -98,12 +138,19 @@ def title_cluster_page_break_warning(
     return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessingDecision:
-    """Decision on how to process manuscript based on warnings."""
+    """Decision on how to process manuscript based on warnings.
+
+    Frozen + slots: decisions are produced once per service, read many
+    times (worker, Operator Notes, QA result dict) and never mutated —
+    slots drops the per-instance __dict__ and frozen makes sharing
+    across the worker's thread overlaps safe by construction.
+    degradations is a tuple for the same reason.
+    """
     action: str  # "FAIL", "DEGRADE", or "PROCEED"
     reason: Optional[str] = None
-    degradations: Optional[List[str]] = None
+    degradations: Optional[Tuple[str, ...]] = None
 
 
 class WarningHandler:
@@ -149,31 +196,16 @@ class WarningHandler:
 
     def __init__(self):
         """Initialize with processing policy rules."""
-        # FAIL rules: Cannot process at all
-        self.fail_rules = {
-            'DETECTED_IMAGES': 'Images not supported in MVP',
-            'DETECTED_TABLES': 'Tables not supported in MVP',
-        }
-        
-        # DEGRADE rules: Can process with fallback rendering
-        self.degrade_rules = {
-            'DETECTED_FOOTNOTES': 'Footnotes rendered inline',
-            'POEM_LIKE_BLOCKS': 'Poetry rendered as blockquotes',
-            'UNICODE_RISK': 'Non-standard characters may render incorrectly',
-            'EXCESSIVE_WHITESPACE': 'Extra spacing normalized',
-            'CENTERED_TEXT_BLOCKS': 'Centered text rendered left-aligned',
-            'OCR_ARTIFACTS': 'OCR errors may affect quality',
-            'FORMATTING_INCONSISTENCY': 'Inconsistent formatting normalized',
-        }
-        
-        # PROCEED rules: Can process normally (just log)
-        self.proceed_rules = {
-            'LOW_CHAPTER_CONFIDENCE': 'Chapter detection uncertain but proceeding',
-        }
-        
+        # The rule tables are module-level frozen mappings; instances
+        # just hold references to the shared views.
+        self.fail_rules = _FAIL_RULES
+        self.degrade_rules = _DEGRADE_RULES
+        self.proceed_rules = _PROCEED_RULES
+        self._rule_table = _RULE_TABLE
+
         # Thresholds for multiple warnings
         self.max_degrade_warnings = 5  # If more than 5 DEGRADE warnings, fail
-    
+
     def evaluate(self, warnings: List[Dict[str, Any]]) -> ProcessingDecision:
         """
         Evaluate warnings and decide processing strategy.
@@ -190,20 +222,39 @@ class WarningHandler:
         
         logger.info(f"Evaluating {len(warnings)} warnings")
         
-        # Check for FAIL conditions. Skip malformed warnings (no rule/
-        # code field at all) — log the count, don't crash. v2.0 rule
-        # IDs (V-###, H-###) won't match self.fail_rules; they're
-        # advisory and fall through to PROCEED. Same applies to the
-        # DEGRADE / PROCEED loops below.
+        # One classifying pass over the list. Skip malformed warnings
+        # (no rule/code field at all) — log the count, don't crash.
+        # v2.0 rule IDs (V-###, H-###) have no entries in the rule
+        # table; they're advisory and land in the unknown bucket,
+        # which falls through to PROCEED.
         malformed_count = 0
         fail_warnings = []
+        degrade_warnings = []
+        degradations = []
+        proceed_warnings = []
+        proceed_messages = []
+        unknown_warnings = []
+
+        classify = self._rule_table.get
         for warning in warnings:
             code = _warning_code(warning)
             if code is None:
                 malformed_count += 1
                 continue
-            if code in self.fail_rules:
+            rule = classify(code)
+            if rule is None:
+                unknown_warnings.append(code)
+                continue
+            bucket, message = rule
+            if bucket == 'FAIL':
                 fail_warnings.append(code)
+            elif bucket == 'DEGRADE':
+                degrade_warnings.append(code)
+                degradations.append(message)
+            else:
+                proceed_warnings.append(code)
+                proceed_messages.append(message)
+
         if malformed_count:
             logger.warning(
                 f"{malformed_count} warning(s) carried neither 'rule' nor "
@@ -216,18 +267,6 @@ class WarningHandler:
             logger.error(f"FAIL decision: {reason}")
             return ProcessingDecision(action="FAIL", reason=reason)
         
-        # Check for DEGRADE conditions
-        degrade_warnings = []
-        degradations = []
-
-        for warning in warnings:
-            code = _warning_code(warning)
-            if code is None:
-                continue
-            if code in self.degrade_rules:
-                degrade_warnings.append(code)
-                degradations.append(self.degrade_rules[code])
-        
         # If too many DEGRADE warnings, fail
         if len(degrade_warnings) > self.max_degrade_warnings:
             reason = f"Too many edge cases ({len(degrade_warnings)} warnings) - quality would be poor"
@@ -241,38 +280,21 @@ class WarningHandler:
             return ProcessingDecision(
                 action="DEGRADE",
                 reason=f"{len(degrade_warnings)} edge cases detected",
-                degradations=degradations
+                degradations=tuple(degradations)
             )
         
-        # Check for PROCEED conditions (informational only)
-        proceed_warnings = []
-        for warning in warnings:
-            code = _warning_code(warning)
-            if code is None:
-                continue
-            if code in self.proceed_rules:
-                proceed_warnings.append(code)
-                logger.info(f"  - {self.proceed_rules[code]}")
-        
+        # PROCEED conditions (informational only)
         if proceed_warnings:
+            for message in proceed_messages:
+                logger.info(f"  - {message}")
             logger.info(f"PROCEED decision with {len(proceed_warnings)} informational warnings")
             return ProcessingDecision(action="PROCEED")
-        
+
         # Unknown warnings - log and proceed. With v2.0 artifacts, the
         # entire V-001..V-004 / H-001 set lands here today (no rule
         # entries in any of the three legacy maps). That's correct
         # interim behavior — the proper v2.0 rule-bucket mapping is on
         # the post-unblock punchlist.
-        unknown_warnings = []
-        for w in warnings:
-            code = _warning_code(w)
-            if code is None:
-                continue
-            if (code not in self.fail_rules
-                    and code not in self.degrade_rules
-                    and code not in self.proceed_rules):
-                unknown_warnings.append(code)
-
         if unknown_warnings:
             logger.warning(f"Unknown warning codes: {unknown_warnings} - proceeding anyway")
 
@@ -280,9 +302,10 @@ class WarningHandler:
     
     def get_policy_summary(self) -> Dict[str, Any]:
         """Get summary of processing policy rules."""
+        # Plain dict copies — the frozen views aren't JSON-serializable.
         return {
-            'fail_rules': self.fail_rules,
-            'degrade_rules': self.degrade_rules,
-            'proceed_rules': self.proceed_rules,
+            'fail_rules': dict(self.fail_rules),
+            'degrade_rules': dict(self.degrade_rules),
+            'proceed_rules': dict(self.proceed_rules),
             'max_degrade_warnings': self.max_degrade_warnings
         }
@@ -21,7 +21,7 @@ Architecture:
 5. Validate artifact schema
 6. Check warnings (FAIL/DEGRADE/PROCEED)
 7. Convert blocks to LaTeX
-8. Generate PDF with Pandoc + XeLaTeX
+8. Generate PDF with XeLaTeX
 9. Validate PDF quality
 10. Upload to R2
 11. Update Airtable Service record (Status → Complete)
@@ -34,11 +34,15 @@ Date: 2026-01-05
 import os
 import sys
 import json
+import orjson
 import logging
+import threading
 import subprocess
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from uuid import uuid4
 
 from lib.pronto_r2_client import ProntoR2Client
@@ -66,6 +70,43 @@ logger = logging.getLogger(__name__)
 # Referenced by app.py's /health endpoint — bump only here.
 WORKER_VERSION = "1.12.0-a1"
 
+# Shared pipeline components, one of each per process. None of them
+# holds per-service state (the converter's list state lives in a
+# per-convert _ListState; the validator's pdfinfo cache is keyed by
+# path+mtime), so every InteriorProcessor — and the H-001 title-page
+# path below — reuses the same instances instead of re-paying
+# construction (PDFGenerator probes xelatex and latexmk via
+# subprocess; the converter rebuilds its bound-handler table). Built
+# lazily, not at import: PDFGenerator's probe raises without xelatex
+# on PATH, and this module is imported by tests and tooling that
+# lack it — the same reason app.py builds its processor lazily.
+_latex_converter: Optional['BlocksToLatexConverter'] = None
+_pdf_generator: Optional['PDFGenerator'] = None
+_pdf_validator: Optional['PDFValidator'] = None
+
+
+def _get_latex_converter() -> BlocksToLatexConverter:
+    global _latex_converter
+    if _latex_converter is None:
+        # Benign race, as in app._get_processor: construction is
+        # idempotent, so a rare double-build just discards one.
+        _latex_converter = BlocksToLatexConverter()
+    return _latex_converter
+
+
+def _get_pdf_generator() -> PDFGenerator:
+    global _pdf_generator
+    if _pdf_generator is None:
+        _pdf_generator = PDFGenerator()
+    return _pdf_generator
+
+
+def _get_pdf_validator() -> PDFValidator:
+    global _pdf_validator
+    if _pdf_validator is None:
+        _pdf_validator = PDFValidator()
+    return _pdf_validator
+
 
 def _system_title_page_latex(artifact: Dict[str, Any],
                              title_sink_in: float = 2.0) -> str:
@@ -87,7 +128,7 @@ def _system_title_page_latex(artifact: Dict[str, Any],
         for r in (artifact.get("applied_rules") or [])
     )
     if h001_fired:
-        cluster = BlocksToLatexConverter().render_title_page_cluster(
+        cluster = _get_latex_converter().render_title_page_cluster(
             (artifact.get("content") or {}).get("blocks") or []
         )
         return (
@@ -135,6 +176,19 @@ def _toc_block_latex(blocks) -> str:
 
 class InteriorProcessor:
     """Main Worker 2 processor."""
+
+    # Lazily created in _get_formatting_parameters — tests build bare
+    # instances via __new__ and never run __init__. Access goes
+    # through _params_lock: the Step 3/4 pool reads/writes this cache
+    # from a worker thread, and TTLCache is not thread-safe (same
+    # invariant the AirtableClient record caches hold). The lock is
+    # class-level for the same bare-instance reason.
+    _params_cache: Optional[TTLCache] = None
+    _params_lock = threading.Lock()
+
+    # Class-level so bare test instances (built via __new__, no
+    # __init__) can still run the terminal-write helpers.
+    worker_version: str = WORKER_VERSION
     
     def __init__(self):
         """Initialize processor with all dependencies."""
@@ -152,15 +206,63 @@ class InteriorProcessor:
         self.airtable_client = AirtableClient()
         self.artifact_downloader = ArtifactDownloader(self.r2_client)
         
-        # Initialize processors
+        # Initialize processors. The converter/generator/validator are
+        # the process-wide shared instances (see module level); the
+        # warning handler stays per-instance — its rule tables are
+        # already module-level frozen views, so it is only a cheap
+        # shell around them.
         self.warning_handler = WarningHandler()
-        self.latex_converter = BlocksToLatexConverter()
-        self.pdf_generator = PDFGenerator()
-        self.pdf_validator = PDFValidator()
+        self.latex_converter = _get_latex_converter()
+        self.pdf_generator = _get_pdf_generator()
+        self.pdf_validator = _get_pdf_validator()
         
-        # Work directory
-        self.work_dir = Path("/tmp/worker_2")
-        self.work_dir.mkdir(exist_ok=True)
+        # Work directory. XeLaTeX does heavy sync I/O on .aux/.log/.toc
+        # between passes, so the default lives on tmpfs (/dev/shm —
+        # container /tmp is usually overlayfs-backed disk) when it has
+        # real capacity. Overridable via WORKER2_WORK_DIR; falls back
+        # to /tmp where /dev/shm is absent, unwritable or too small.
+        self.work_dir = self._init_work_dir()
+
+    # Minimum free space before /dev/shm is taken as the work dir.
+    # Docker's default shm is 64 MB, while one build's .tex + aux +
+    # .xdv + PDF can run to hundreds of MB (PDFValidator accepts PDFs
+    # up to 500 MB) — tmpfs builds need the container started with
+    # --shm-size=512m or larger (see Dockerfile). Short of that,
+    # disk-backed /tmp beats ENOSPC mid-compile.
+    _MIN_SHM_FREE_BYTES = 512 * 1024 * 1024
+
+    @classmethod
+    def _init_work_dir(cls) -> Path:
+        candidates = [os.environ.get('WORKER2_WORK_DIR'),
+                      '/dev/shm/worker_2', '/tmp/worker_2']
+        for candidate in candidates:
+            if not candidate:
+                continue
+            work_dir = Path(candidate)
+            try:
+                work_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Work dir {work_dir} unavailable: {e}")
+                continue
+            if candidate == '/dev/shm/worker_2':
+                try:
+                    stats = os.statvfs(work_dir)
+                    free = stats.f_bavail * stats.f_frsize
+                except OSError as e:
+                    logger.warning(f"Could not stat {work_dir}: {e}")
+                    free = 0
+                if free < cls._MIN_SHM_FREE_BYTES:
+                    logger.warning(
+                        f"/dev/shm has {free // (1024 * 1024)} MB free, "
+                        f"below the {cls._MIN_SHM_FREE_BYTES // (1024 * 1024)}"
+                        f" MB a build needs; using disk-backed /tmp "
+                        f"(start the container with --shm-size=512m for "
+                        f"tmpfs builds)"
+                    )
+                    continue
+            logger.info(f"Work directory: {work_dir}")
+            return work_dir
+        raise RuntimeError("No writable work directory available")
     
     def process_service(self, service_id: str) -> Dict[str, Any]:
         """
@@ -203,15 +305,25 @@ class InteriorProcessor:
             # Step 2: CANONICAL - Claim the service
             self._claim_service(service_id)
             
-            # Step 3: CANONICAL - Find manuscript artifact via deterministic dependency lookup
-            manuscript_artifact_url = self._find_manuscript_artifact(service)
+            # Steps 3+4 in parallel: the dependency lookup (Step 3) and
+            # the Project → Book Metadata chain (Step 4) are independent
+            # read-only Airtable walks, each several serial round-trips
+            # deep — overlapping them cuts the pre-build wall time to
+            # the slower of the two instead of their sum.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                artifact_url_future = executor.submit(
+                    self._find_manuscript_artifact, service)
+                params_future = executor.submit(
+                    self._get_formatting_parameters, service)
+                # Step 3: CANONICAL - Find manuscript artifact via deterministic dependency lookup
+                manuscript_artifact_url = artifact_url_future.result()
+                # Step 4: CANONICAL - Get formatting parameters from linked Book Metadata
+                params = params_future.result()
+
             if not manuscript_artifact_url:
                 raise ValueError("Could not find manuscript artifact from Worker 1 dependency")
-            
+
             logger.info(f"[{run_id}] Found manuscript artifact: {manuscript_artifact_url}")
-            
-            # Step 4: CANONICAL - Get formatting parameters from linked Book Metadata
-            params = self._get_formatting_parameters(service)
             logger.info(f"[{run_id}] Formatting parameters: {params}")
 
             # E4 gate: explicitly flagged book whose flag has no Bowker
@@ -220,7 +332,9 @@ class InteriorProcessor:
                 reason = f"E4: {params['imprint_hold']}"
                 self.airtable_client.update_service(service_id, {
                     'Status': 'Review',
+                    'Started At': started_at.isoformat(),
                     'Finished At': datetime.now(timezone.utc).isoformat(),
+                    'Worker Version': self.worker_version,
                     'Operator Notes': f"Interior build HELD: {reason}",
                 }, typecast=True)
                 return {'success': True, 'service_id': service_id,
@@ -234,7 +348,9 @@ class InteriorProcessor:
                 reason = f"Trim: {params['trim_hold']}"
                 self.airtable_client.update_service(service_id, {
                     'Status': 'Review',
+                    'Started At': started_at.isoformat(),
                     'Finished At': datetime.now(timezone.utc).isoformat(),
+                    'Worker Version': self.worker_version,
                     'Operator Notes': f"Interior build HELD: {reason}",
                 }, typecast=True)
                 return {'success': True, 'service_id': service_id,
@@ -360,7 +476,9 @@ class InteriorProcessor:
                     reason = "E3 figures: " + "; ".join(fig_holds)
                     self.airtable_client.update_service(service_id, {
                         'Status': 'Review',
+                        'Started At': started_at.isoformat(),
                         'Finished At': datetime.now(timezone.utc).isoformat(),
+                        'Worker Version': self.worker_version,
                         'Operator Notes': f"Interior build HELD: {reason}",
                     }, typecast=True)
                     return {'success': True, 'service_id': service_id,
@@ -469,12 +587,18 @@ class InteriorProcessor:
                 )
             )
             
-            # Save complete LaTeX document to work directory
+            # Save complete LaTeX document to work directory. One
+            # explicit encode, then raw bytes out — write_text would
+            # route the whole document through TextIOWrapper's chunked
+            # encoder. (Making convert() itself return bytes was
+            # rejected: its str contract is pinned by the exact-output
+            # tests, and the converter already assembles via a single
+            # list + "".join pass.)
             latex_file = self.work_dir / f"{run_id}.tex"
-            latex_file.write_text(latex_content, encoding='utf-8')
+            latex_file.write_bytes(latex_content.encode('utf-8'))
             logger.info(f"[{run_id}] LaTeX generated (templated): {latex_file}")
             
-            # Step 8: Generate PDF with Pandoc + XeLaTeX
+            # Step 8: Generate PDF with XeLaTeX
             pdf_file = self.pdf_generator.generate(
                 latex_file=latex_file,
                 output_dir=self.work_dir,
@@ -490,43 +614,61 @@ class InteriorProcessor:
             
             logger.info(f"[{run_id}] PDF validated: {pdf_validation['page_count']} pages")
             
-            # Step 10: Upload PDF to R2
+            # Step 10: Upload PDF to R2. The PUT runs in the background
+            # so its latency hides behind the QA review (step 10b),
+            # which only reads the local file — the two finished
+            # serially before, adding the full transfer time to every
+            # run.
             pdf_key = f"services/{service_id}/interior.pdf"
-            if figures_manifest is not None:
-                self.r2_client.upload_json(
-                    f"services/{service_id}/figures_manifest.json",
-                    figures_manifest)
-            upload_result = self.r2_client.upload_file(
-                file_path=str(pdf_file),
-                object_key=pdf_key,
-                content_type="application/pdf"
-            )
-            
+
+            def _upload_outputs():
+                if figures_manifest is not None:
+                    # Manifest + PDF go up concurrently — the uploads
+                    # are independent, so wall-clock is the PDF
+                    # transfer alone.
+                    return self.r2_client.upload_many([
+                        (f"services/{service_id}/figures_manifest.json",
+                         figures_manifest, "application/json"),
+                        (pdf_key, str(pdf_file), "application/pdf"),
+                    ])[pdf_key]
+                return self.r2_client.upload_file(
+                    file_path=str(pdf_file),
+                    object_key=pdf_key,
+                    content_type="application/pdf"
+                )
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                upload_future = executor.submit(_upload_outputs)
+
+                # Step 10b: QA review (QA_Reviewer v0). Since Trims v0
+                # the spec carries the ORDERED trim (parsed + template-
+                # matched upstream), so QA now verifies output = order —
+                # the whole point of the trim gate.
+                qa_geom = trims.INTERIOR_GEOMETRY[params['trim_name']]
+                qa_config = qa.QAConfig.from_env()
+                qa_result = qa.review(
+                    artifact=str(pdf_file),
+                    spec=qa.QASpec(
+                        artifact_type="Interior PDF",
+                        trim=params['trim_dims'],
+                        page_count=pdf_validation['page_count'],
+                        inside_margin_in=qa_geom.inner_in, r2_key=pdf_key,
+                        binding=params['binding']),
+                    r2=self.r2_client, config=qa_config)
+                qa_fields = qa_result.airtable_fields(qa_config)
+                if qa_result.should_block(qa_config):
+                    qa_reason = f"QA: {qa_result.hold_summary()}"
+                    review_reason = (f"{review_reason}; {qa_reason}"
+                                     if review_reason else qa_reason)
+                    qa_fields.update(qa_result.blocked_fields())
+
+                # An upload failure surfaces here and routes through
+                # _fail_service like any other step.
+                upload_result = upload_future.result()
+
             pdf_url = upload_result['public_url']
             logger.info(f"[{run_id}] PDF uploaded: {pdf_url}")
 
-            # Step 10b: QA review (QA_Reviewer v0). Since Trims v0 the
-            # spec carries the ORDERED trim (parsed + template-matched
-            # upstream), so QA now verifies output = order — the whole
-            # point of the trim gate.
-            qa_geom = trims.INTERIOR_GEOMETRY[params['trim_name']]
-            qa_config = qa.QAConfig.from_env()
-            qa_result = qa.review(
-                artifact=str(pdf_file),
-                spec=qa.QASpec(
-                    artifact_type="Interior PDF",
-                    trim=params['trim_dims'],
-                    page_count=pdf_validation['page_count'],
-                    inside_margin_in=qa_geom.inner_in, r2_key=pdf_key,
-                    binding=params['binding']),
-                r2=self.r2_client, config=qa_config)
-            qa_fields = qa_result.airtable_fields(qa_config)
-            if qa_result.should_block(qa_config):
-                qa_reason = f"QA: {qa_result.hold_summary()}"
-                review_reason = (f"{review_reason}; {qa_reason}"
-                                 if review_reason else qa_reason)
-                qa_fields.update(qa_result.blocked_fields())
-
             # Step 11: CANONICAL - Update Airtable with Complete status
             completed_at = datetime.now(timezone.utc)
             duration = (completed_at - started_at).total_seconds()
@@ -539,7 +681,8 @@ class InteriorProcessor:
                 duration=duration,
                 degradations=decision.degradations,
                 review_reason=review_reason,
-                qa_fields=qa_fields
+                qa_fields=qa_fields,
+                started_at=started_at
             )
 
             logger.info(f"[{run_id}] Service updated in Airtable")
@@ -562,9 +705,21 @@ class InteriorProcessor:
             
         except Exception as e:
             logger.error(f"[{run_id}] Processing failed: {str(e)}", exc_info=True)
-            
+
+            # Failed runs never reach the Step 12 unlinks, and on the
+            # tmpfs work dir every leaked .tex/.pdf/aux file would stay
+            # pinned in RAM for the life of the process. All of a run's
+            # work files are run_id-prefixed, so one glob drops them.
+            try:
+                for leftover in self.work_dir.glob(f"{run_id}*"):
+                    leftover.unlink(missing_ok=True)
+            except OSError as cleanup_error:
+                logger.warning(
+                    f"[{run_id}] Could not clean work files: {cleanup_error}"
+                )
+
             # CANONICAL - Update Airtable with Failed status
-            self._fail_service(service_id, str(e))
+            self._fail_service(service_id, str(e), started_at=started_at)
             
             return {
                 'success': False,
@@ -593,28 +748,39 @@ class InteriorProcessor:
             return None
         
         logger.info(f"Searching {len(dependencies)} dependencies for Manuscript Processing service")
-        
-        # Iterate through dependencies to find the Worker 1 service
+
+        # Batched lookups: every dependency Service in ceil(N/10)
+        # round-trips, then their distinct Service Types in one more —
+        # the old per-dependency loop paid two serial Airtable calls
+        # (~150ms each) per entry, which dominated wall time here.
+        dep_services = self.airtable_client.get_services(dependencies)
         for dep_id in dependencies:
-            dep_service = self.airtable_client.get_service(dep_id)
-            
-            if not dep_service:
+            if dep_id not in dep_services:
                 logger.warning(f"Could not fetch dependency {dep_id}")
+
+        type_ids = [links[0] for links in
+                    (dep.get('Service Type', []) for dep in dep_services.values())
+                    if links]
+        service_types = self.airtable_client.get_service_types(type_ids)
+
+        # Dependency order still decides which match wins.
+        for dep_id in dependencies:
+            dep_service = dep_services.get(dep_id)
+
+            if not dep_service:
                 continue
-            
+
             # Get the Service Type (this is a linked record, so we get the ID)
             service_type_links = dep_service.get('Service Type', [])
-            
+
             if not service_type_links:
                 continue
-            
-            # Fetch the Service Type record to get its name
-            service_type_id = service_type_links[0]
-            service_type = self.airtable_client.get_service_type(service_type_id)
-            
+
+            service_type = service_types.get(service_type_links[0])
+
             if not service_type:
                 continue
-            
+
             service_type_name = service_type.get('Service Name', '')
             
             logger.info(f"Checking dependency {dep_id}: Service Type = {service_type_name}")
@@ -667,6 +833,22 @@ class InteriorProcessor:
                 return defaults
             
             project_id = project_links[0]
+
+            # Formatting parameters memoized per Project: many services
+            # in a batch share one Project → Book Metadata chain, and
+            # the resolved params (trim/binding/genre arbitration
+            # included) don't vary between them. TTL matches the
+            # reference-table record cache so operator edits surface
+            # on the same schedule.
+            with self._params_lock:
+                if self._params_cache is None:
+                    self._params_cache = TTLCache(maxsize=256, ttl=300)
+                cached = self._params_cache.get(project_id)
+            if cached is not None:
+                logger.info(f"Formatting parameters for Project {project_id} served from cache")
+                # Shallow copy: callers may attach run-local keys.
+                return dict(cached)
+
             project = self.airtable_client.get_project(project_id)
             
             if not project:
@@ -778,7 +960,9 @@ class InteriorProcessor:
                 params['imprint_hold'] = str(e)
 
             logger.info("Successfully retrieved formatting parameters from Book Metadata")
-            return params
+            with self._params_lock:
+                self._params_cache[project_id] = params
+            return dict(params)
             
         except Exception as e:
             logger.error(f"Error getting formatting parameters: {e}, using defaults")
@@ -787,14 +971,29 @@ class InteriorProcessor:
     def _claim_service(self, service_id: str):
         """
         CANONICAL: Claim the service by setting Status to Processing.
+
+        The claim write carries Status only. Started At and Worker
+        Version used to ride along here, but they are descriptive
+        rather than claim-relevant — other workers only look at
+        Status — so they now land with the terminal write (_complete_
+        service / _fail_service / the Review holds) instead, keeping
+        the critical-path PATCH payload minimal. Airtable has no
+        conditional update, so claim-or-abort is the Step 1a status
+        check in process_service plus this unconditional write, not a
+        server-side compare-and-set.
+
+        This one write is deliberately synchronous and immediate —
+        deferring it into the terminal PATCH (or a delayed background
+        flush) would leave a window where a second worker's Step 1a
+        check sees a stale Status and double-builds the book. The
+        Started At / Finished At stamps, which nothing races on, are
+        the part that got coalesced into the terminal write.
         """
         fields = {
             # NOTE: Only use 'Status' (singular), never 'Statuses' (plural)
             'Status': 'Processing',
-            'Started At': datetime.now(timezone.utc).isoformat(),
-            'Worker Version': self.worker_version
         }
-        
+
         self.airtable_client.update_service(service_id, fields)
         logger.info(f"Claimed service {service_id}: Status → Processing")
     
@@ -805,9 +1004,10 @@ class InteriorProcessor:
         pdf_key: str,
         page_count: int,
         duration: float,
-        degradations: Optional[List[str]],
+        degradations: Optional[Sequence[str]],
         review_reason: Optional[str] = None,
-        qa_fields: Optional[Dict[str, Any]] = None
+        qa_fields: Optional[Dict[str, Any]] = None,
+        started_at: Optional[datetime] = None
     ):
         """
         CANONICAL: Mark service as Complete and store outputs.
@@ -835,8 +1035,12 @@ class InteriorProcessor:
             # this field as a tripwire cross-check only, never a
             # source. Same number that already goes into Operator
             # Notes, now structured.
-            'Interior Page Count': page_count
+            'Interior Page Count': page_count,
+            # Deferred from the claim write (see _claim_service).
+            'Worker Version': self.worker_version
         }
+        if started_at is not None:
+            fields['Started At'] = started_at.isoformat()
 
         # Store additional metadata in Operator Notes
         metadata = {
@@ -846,7 +1050,11 @@ class InteriorProcessor:
         }
         if review_reason:
             metadata['review_gate'] = review_reason
-        fields['Operator Notes'] = f"Interior PDF: {json.dumps(metadata, indent=2)}"
+        # orjson for the metadata blob — same "key": value shape as
+        # stdlib indent=2, without the pure-Python serialize pass.
+        # (main()'s CLI dump stays on stdlib json; it isn't hot.)
+        notes_json = orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode()
+        fields['Operator Notes'] = f"Interior PDF: {notes_json}"
         if qa_fields:
             fields.update(qa_fields)
 
@@ -869,7 +1077,8 @@ class InteriorProcessor:
             )
         logger.info(f"Completed service {service_id}: Status → {status}")
     
-    def _fail_service(self, service_id: str, error_message: str):
+    def _fail_service(self, service_id: str, error_message: str,
+                      started_at: Optional[datetime] = None):
         """
         CANONICAL: Mark service as Failed and store error details.
         Uses canonical Error Log field (not Error Message).
@@ -879,39 +1088,72 @@ class InteriorProcessor:
             'Status': 'Failed',
             'Finished At': datetime.now(timezone.utc).isoformat(),
             # CANONICAL: Use Error Log field
-            'Error Log': error_message
+            'Error Log': error_message,
+            # Deferred from the claim write (see _claim_service).
+            'Worker Version': self.worker_version
         }
+        if started_at is not None:
+            fields['Started At'] = started_at.isoformat()
         
         self.airtable_client.update_service(service_id, fields)
         logger.info(f"Failed service {service_id}: Status → Failed")
 
 
-def main():
-    """CLI entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python pronto_worker_2_v1.1.0_canonical.py <service_id>")
-        sys.exit(1)
-    
-    service_id = sys.argv[1]
-    
-    # Validate environment
+def _check_environment() -> None:
+    """Exit if required environment variables are missing."""
     required_vars = [
         'R2_ACCOUNT_ID',
         'R2_ACCESS_KEY_ID',
         'R2_SECRET_ACCESS_KEY',
         'R2_PUBLIC_BASE_URL'
     ]
-    
+
     missing = [var for var in required_vars if not os.getenv(var)]
     if missing:
         logger.error(f"Missing required environment variables: {', '.join(missing)}")
         sys.exit(1)
-    
+
+
+def main_daemon():
+    """Long-running mode: one processor, service IDs from stdin.
+
+    Constructing InteriorProcessor pays for boto3 client setup,
+    Airtable session + caches, and the xelatex probe; a fresh
+    CLI process re-pays all of it per service. Daemon mode builds the
+    processor once and reuses its warm connection pools and caches for
+    every line (one service ID per line; blank lines are skipped).
+    The webhook path gets the same effect from app._get_processor().
+    """
+    _check_environment()
+
+    processor = InteriorProcessor()
+    for line in sys.stdin:
+        service_id = line.strip()
+        if not service_id:
+            continue
+        result = processor.process_service(service_id)
+        print(json.dumps(result, indent=2), flush=True)
+
+
+def main():
+    """CLI entry point."""
+    if len(sys.argv) >= 2 and sys.argv[1] == '--daemon':
+        main_daemon()
+        return
+
+    if len(sys.argv) < 2:
+        print("Usage: python pronto_worker_2_v1.1.0_canonical.py <service_id> | --daemon")
+        sys.exit(1)
+
+    service_id = sys.argv[1]
+
+    _check_environment()
+
     processor = InteriorProcessor()
     result = processor.process_service(service_id)
-    
+
     print(json.dumps(result, indent=2))
-    
+
     sys.exit(0 if result['success'] else 1)
 
 
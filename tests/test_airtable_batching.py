@@ -0,0 +1,154 @@
+"""AirtableClient batched-read cache behavior and batched writes —
+the network edge is stubbed at _fetch_chunk / the pyairtable table
+handle, so these exercise only the local logic: cache tier selection,
+hit vs miss, negative-cache suppression, fetch-error handling, and
+invalidation after updates. upload_many's fan-out lives in
+test_r2_upload_many.py."""
+
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cachetools import TTLCache
+
+from lib.airtable_client import AirtableClient
+
+
+def _client():
+    # __init__ requires live credentials and builds a pooled session —
+    # none of that matters to the cache logic, so skip it.
+    c = AirtableClient.__new__(AirtableClient)
+    c.table_name = "Services"
+    c._tables = {"Services": MagicMock(), "Projects": MagicMock()}
+    c.table = c._tables["Services"]
+    c._record_cache = TTLCache(maxsize=64, ttl=60)
+    c._reference_cache = TTLCache(maxsize=64, ttl=300)
+    c._negative_cache = TTLCache(maxsize=64, ttl=10)
+    c._cache_lock = threading.Lock()
+    return c
+
+
+def _fetched(*record_ids):
+    return [{"id": rid, "fields": {"Name": rid}} for rid in record_ids]
+
+
+class TestGetRecordsCaching(unittest.TestCase):
+    def test_miss_fetches_then_hit_skips_fetch(self):
+        c = _client()
+        c._fetch_chunk = MagicMock(return_value=_fetched("recAAA1"))
+
+        first = c.get_records("Services", ["recAAA1"])
+        second = c.get_records("Services", ["recAAA1"])
+
+        self.assertEqual(first["recAAA1"]["Name"], "recAAA1")
+        self.assertEqual(second, first)
+        c._fetch_chunk.assert_called_once()
+
+    def test_reference_table_uses_reference_cache(self):
+        c = _client()
+        c._fetch_chunk = MagicMock(return_value=_fetched("recProj1"))
+
+        c.get_records("Projects", ["recProj1"])
+
+        self.assertIn(("Projects", "recProj1"), c._reference_cache)
+        self.assertNotIn(("Projects", "recProj1"), c._record_cache)
+
+    def test_missing_record_negative_cached_suppresses_round_trip(self):
+        c = _client()
+        # Airtable positively reports the record absent (empty list).
+        c._fetch_chunk = MagicMock(return_value=[])
+
+        first = c.get_records("Services", ["recGone1"])
+        second = c.get_records("Services", ["recGone1"])
+
+        self.assertEqual(first, {})
+        self.assertEqual(second, {})
+        c._fetch_chunk.assert_called_once()
+
+    def test_fetch_error_is_not_negative_cached(self):
+        c = _client()
+        # None = fetch error; the record may exist, so the next call
+        # must retry the round-trip.
+        c._fetch_chunk = MagicMock(side_effect=[None, _fetched("recAAA1")])
+
+        first = c.get_records("Services", ["recAAA1"])
+        second = c.get_records("Services", ["recAAA1"])
+
+        self.assertEqual(first, {})
+        self.assertEqual(second["recAAA1"]["Name"], "recAAA1")
+        self.assertEqual(c._fetch_chunk.call_count, 2)
+
+    def test_malformed_id_rejected_without_fetch(self):
+        c = _client()
+        c._fetch_chunk = MagicMock(return_value=[])
+
+        result = c.get_records("Services", ["rec'); DELETE"])
+
+        self.assertEqual(result, {})
+        c._fetch_chunk.assert_not_called()
+
+    def test_ids_chunked_by_ten(self):
+        c = _client()
+        c._fetch_chunk = MagicMock(return_value=[])
+
+        c.get_records("Services", [f"recID{n:04d}" for n in range(25)])
+
+        sizes = sorted(len(call.args[2])
+                       for call in c._fetch_chunk.call_args_list)
+        self.assertEqual(sizes, [5, 10, 10])
+
+
+class TestUpdateInvalidation(unittest.TestCase):
+    def test_update_service_drops_cached_copy(self):
+        c = _client()
+        c._record_cache[("Services", "recAAA1")] = {"Status": "Pending"}
+
+        self.assertTrue(c.update_service("recAAA1", {"Status": "Processing"}))
+
+        self.assertNotIn(("Services", "recAAA1"), c._record_cache)
+
+    def test_update_service_failure_returns_false(self):
+        c = _client()
+        c.table.update.side_effect = RuntimeError("422")
+
+        self.assertFalse(c.update_service("recAAA1", {"Status": "Processing"}))
+
+
+class TestUpdateServices(unittest.TestCase):
+    def test_batches_of_ten_and_per_update_flags(self):
+        c = _client()
+        updates = [(f"recID{n:04d}", {"Status": "Complete"})
+                   for n in range(12)]
+
+        results = c.update_services(updates)
+
+        self.assertEqual(results, [True] * 12)
+        self.assertEqual(c.table.batch_update.call_count, 2)
+        first_batch = c.table.batch_update.call_args_list[0].args[0]
+        self.assertEqual(len(first_batch), 10)
+
+    def test_failed_batch_marks_its_chunk_failed(self):
+        c = _client()
+        c.table.batch_update.side_effect = [RuntimeError("503"), None]
+        updates = [(f"recID{n:04d}", {"Status": "Complete"})
+                   for n in range(12)]
+
+        results = c.update_services(updates)
+
+        self.assertEqual(results, [False] * 10 + [True] * 2)
+
+    def test_successful_update_invalidates_cache(self):
+        c = _client()
+        c._record_cache[("Services", "recAAA1")] = {"Status": "Pending"}
+
+        c.update_services([("recAAA1", {"Status": "Complete"})])
+
+        self.assertNotIn(("Services", "recAAA1"), c._record_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
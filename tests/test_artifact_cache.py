@@ -0,0 +1,161 @@
+"""ArtifactDownloader disk cache — the 304-serve path and the LRU
+eviction accounting are pure-local logic; the R2 edge is a fake
+download_bytes_conditional. Eviction runs against a small
+_CACHE_MAX_BYTES override so the tests write kilobytes, not
+gigabytes."""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.artifact_downloader import ArtifactDownloader
+
+
+def _downloader(tmp, body=b'{"schema_version": "2.0"}', etag='"e1"'):
+    r2 = MagicMock()
+    r2.download_bytes_conditional.return_value = (body, etag)
+    return ArtifactDownloader(r2, cache_dir=Path(tmp)), r2
+
+
+class TestConditionalFetch(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_full_download_writes_body_and_etag(self):
+        d, r2 = _downloader(self.tmp)
+        d._fetch("services/rec1/manuscript.v1.json")
+
+        digest = hashlib.sha256(
+            b"services/rec1/manuscript.v1.json").hexdigest()
+        self.assertTrue((Path(self.tmp) / f"{digest}.json").exists())
+        self.assertEqual(
+            (Path(self.tmp) / f"{digest}.etag").read_text(), '"e1"')
+        # First fetch has no cached ETag to revalidate.
+        r2.download_bytes_conditional.assert_called_once_with(
+            "services/rec1/manuscript.v1.json", etag=None)
+
+    def test_304_serves_cached_bytes(self):
+        d, r2 = _downloader(self.tmp)
+        first = d._fetch("services/rec1/manuscript.v1.json")
+
+        # Second fetch: server says unchanged (None body).
+        r2.download_bytes_conditional.return_value = (None, '"e1"')
+        second = d._fetch("services/rec1/manuscript.v1.json")
+
+        self.assertEqual(second, first)
+        r2.download_bytes_conditional.assert_called_with(
+            "services/rec1/manuscript.v1.json", etag='"e1"')
+
+    def test_304_with_vanished_body_refetches(self):
+        # Another worker process's eviction can unlink the body
+        # between the ETag read and the 304 — the cache must stay an
+        # optimization, not a dependency.
+        d, r2 = _downloader(self.tmp)
+        first = d._fetch("services/rec1/manuscript.v1.json")
+
+        digest = hashlib.sha256(
+            b"services/rec1/manuscript.v1.json").hexdigest()
+        (Path(self.tmp) / f"{digest}.json").unlink()
+
+        r2.download_bytes_conditional.side_effect = [
+            (None, '"e1"'),                              # the 304
+            (b'{"schema_version": "2.0"}', '"e1"'),      # the refetch
+        ]
+        second = d._fetch("services/rec1/manuscript.v1.json")
+
+        self.assertEqual(second, first)
+        # The refetch must be unconditional.
+        self.assertEqual(
+            r2.download_bytes_conditional.call_args_list[-1].kwargs,
+            {"etag": None})
+        # And the body must be re-cached for the next run.
+        self.assertTrue((Path(self.tmp) / f"{digest}.json").exists())
+
+    def test_changed_object_overwrites_cache(self):
+        d, r2 = _downloader(self.tmp)
+        d._fetch("services/rec1/manuscript.v1.json")
+
+        r2.download_bytes_conditional.return_value = (
+            b'{"schema_version": "2.1"}', '"e2"')
+        result = d._fetch("services/rec1/manuscript.v1.json")
+
+        self.assertEqual(result["schema_version"], "2.1")
+        digest = hashlib.sha256(
+            b"services/rec1/manuscript.v1.json").hexdigest()
+        self.assertEqual(
+            (Path(self.tmp) / f"{digest}.etag").read_text(), '"e2"')
+
+
+class TestEviction(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        self.addCleanup(self._tmp.cleanup)
+
+    def _fill(self, downloader, keys, body):
+        """Fetch each key once, oldest first, with distinct mtimes."""
+        for n, key in enumerate(keys):
+            downloader.r2_client.download_bytes_conditional.return_value = (
+                body, f'"e{n}"')
+            downloader._fetch(key)
+            body_path = next(
+                p for p in Path(self.tmp).glob("*.json")
+                if p.stem == hashlib.sha256(key.encode()).hexdigest())
+            stamp = time.time() - (len(keys) - n) * 100
+            os.utime(body_path, (stamp, stamp))
+
+    def test_oldest_entries_evicted_above_ceiling(self):
+        body = b'{"x": "' + b"a" * 400 + b'"}'  # ~410 bytes each
+        d, _ = _downloader(self.tmp)
+        # Three bodies fit; the fourth crosses the ceiling.
+        with patch("lib.artifact_downloader._CACHE_MAX_BYTES", 1400):
+            self._fill(d, ["k1", "k2", "k3"], body)
+            # Writing a fourth entry pushes the total over the ceiling;
+            # the oldest (k1) must go, paired .etag included.
+            d.r2_client.download_bytes_conditional.return_value = (
+                body, '"e4"')
+            d._fetch("k4")
+
+        k1 = hashlib.sha256(b"k1").hexdigest()
+        k4 = hashlib.sha256(b"k4").hexdigest()
+        self.assertFalse((Path(self.tmp) / f"{k1}.json").exists())
+        self.assertFalse((Path(self.tmp) / f"{k1}.etag").exists())
+        self.assertTrue((Path(self.tmp) / f"{k4}.json").exists())
+
+    def test_under_ceiling_evicts_nothing(self):
+        body = b'{"x": 1}'
+        d, _ = _downloader(self.tmp)
+        with patch("lib.artifact_downloader._CACHE_MAX_BYTES", 10_000):
+            self._fill(d, ["k1", "k2", "k3"], body)
+
+        self.assertEqual(len(list(Path(self.tmp).glob("*.json"))), 3)
+
+    def test_hit_refreshes_recency(self):
+        body = b'{"x": "' + b"a" * 400 + b'"}'
+        d, r2 = _downloader(self.tmp)
+        with patch("lib.artifact_downloader._CACHE_MAX_BYTES", 1400):
+            self._fill(d, ["k1", "k2", "k3"], body)
+            # A 304 hit on k1 bumps its mtime past k2/k3...
+            r2.download_bytes_conditional.return_value = (None, '"e0"')
+            d._fetch("k1")
+            # ...so the next eviction drops k2, not k1.
+            r2.download_bytes_conditional.return_value = (body, '"e4"')
+            d._fetch("k4")
+
+        k1 = hashlib.sha256(b"k1").hexdigest()
+        k2 = hashlib.sha256(b"k2").hexdigest()
+        self.assertTrue((Path(self.tmp) / f"{k1}.json").exists())
+        self.assertFalse((Path(self.tmp) / f"{k2}.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Artifact registry version ordering — regression cover for the
+silent wrong-schema bug: a lexicographic sort picks "9.0" over "10.0"
+the day a two-digit major appears, and the wrong schema loads without
+any error. get_latest_version must compare numerically, and a
+malformed version component must sort behind well-formed versions
+instead of raising."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.artifact_registry import ArtifactRegistry, _version_key
+
+
+def _registry(versions):
+    """ArtifactRegistry over a temp dir holding empty manuscript
+    schema files at the given versions (get_latest_version only reads
+    filenames)."""
+    tmp = tempfile.TemporaryDirectory()
+    artifact_dir = Path(tmp.name) / "manuscript"
+    artifact_dir.mkdir()
+    for version in versions:
+        (artifact_dir / f"manuscript.v{version}.schema.json").write_text("{}")
+    registry = ArtifactRegistry(registry_path=tmp.name)
+    registry._tmp = tmp  # keep the directory alive with the registry
+    return registry
+
+
+class TestVersionKey(unittest.TestCase):
+    def test_numeric_components_compare_as_integers(self):
+        self.assertGreater(_version_key("10.0"), _version_key("9.0"))
+        self.assertGreater(_version_key("2.10"), _version_key("2.9"))
+        self.assertLess(_version_key("1.1"), _version_key("1.2"))
+
+    def test_malformed_component_sorts_behind_wellformed(self):
+        self.assertLess(_version_key("2.0-beta"), _version_key("1.0"))
+        self.assertLess(_version_key(""), _version_key("0.1"))
+
+
+class TestGetLatestVersion(unittest.TestCase):
+    def test_two_digit_major_beats_single_digit(self):
+        registry = _registry(["1.0", "9.0", "10.0"])
+        self.assertEqual(registry.get_latest_version("manuscript"), "10.0")
+
+    def test_two_digit_minor_beats_single_digit(self):
+        registry = _registry(["2.2", "2.10"])
+        self.assertEqual(registry.get_latest_version("manuscript"), "2.10")
+
+    def test_malformed_version_never_wins(self):
+        registry = _registry(["1.0", "2.0-beta"])
+        self.assertEqual(registry.get_latest_version("manuscript"), "1.0")
+
+    def test_no_schemas_returns_none(self):
+        registry = _registry([])
+        self.assertIsNone(registry.get_latest_version("manuscript"))
+
+
+if __name__ == "__main__":
+    unittest.main()
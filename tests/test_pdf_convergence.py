@@ -0,0 +1,149 @@
+"""PDFGenerator rerun logic — the _aux_is_trivial single-pass
+shortcut, the aux/toc digest, and the convergence loop's pass count,
+with subprocess.run replaced by a fake xelatex that writes the PDF
+and aux content per pass. A wrong trivial check here would ship PDFs
+with unresolved TOC/refs and no failure signal."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.pdf_generator import PDFGenerator
+
+
+def _generator():
+    # __init__ probes xelatex/latexmk via subprocess; the rerun logic
+    # needs only the command names.
+    g = PDFGenerator.__new__(PDFGenerator)
+    g.xelatex_cmd = "xelatex"
+    g.latexmk_cmd = None
+    return g
+
+
+class _FakeXelatex:
+    """Stands in for subprocess.run: writes the PDF and the pass's aux
+    content into the output directory named on the command line."""
+
+    def __init__(self, aux_per_pass, toc=None):
+        self.aux_per_pass = aux_per_pass
+        self.toc = toc
+        self.calls = 0
+
+    def __call__(self, cmd, **kwargs):
+        out_dir = Path(cmd[cmd.index("-output-directory") + 1])
+        run_id = cmd[cmd.index("-jobname") + 1]
+        (out_dir / f"{run_id}.pdf").write_bytes(b"%PDF-1.6 fake")
+        aux = self.aux_per_pass[min(self.calls, len(self.aux_per_pass) - 1)]
+        (out_dir / f"{run_id}.aux").write_text(aux)
+        if self.toc is not None:
+            (out_dir / f"{run_id}.toc").write_text(self.toc)
+        self.calls += 1
+
+        class _Result:
+            returncode = 0
+            stdout = ""
+            stderr = ""
+        return _Result()
+
+
+class TestAuxIsTrivial(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_relax_only_aux_is_trivial(self):
+        aux = self.tmp / "run.aux"
+        aux.write_text("\\relax \n\n")
+        self.assertTrue(PDFGenerator._aux_is_trivial(aux))
+
+    def test_label_line_is_not_trivial(self):
+        aux = self.tmp / "run.aux"
+        aux.write_text("\\relax \n\\newlabel{ch:1}{{1}{3}}\n")
+        self.assertFalse(PDFGenerator._aux_is_trivial(aux))
+
+    def test_missing_aux_is_not_trivial(self):
+        self.assertFalse(PDFGenerator._aux_is_trivial(self.tmp / "no.aux"))
+
+
+class TestAuxDigest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_same_content_same_digest(self):
+        aux, toc = self.tmp / "r.aux", self.tmp / "r.toc"
+        aux.write_text("\\newlabel{a}{{1}{3}}\n")
+        first = PDFGenerator._aux_digest(aux, toc)
+        self.assertEqual(first, PDFGenerator._aux_digest(aux, toc))
+
+    def test_changed_aux_changes_digest(self):
+        aux, toc = self.tmp / "r.aux", self.tmp / "r.toc"
+        aux.write_text("\\newlabel{a}{{1}{3}}\n")
+        first = PDFGenerator._aux_digest(aux, toc)
+        aux.write_text("\\newlabel{a}{{1}{4}}\n")
+        self.assertNotEqual(first, PDFGenerator._aux_digest(aux, toc))
+
+    def test_toc_appearing_changes_digest(self):
+        aux, toc = self.tmp / "r.aux", self.tmp / "r.toc"
+        aux.write_text("\\relax \n")
+        first = PDFGenerator._aux_digest(aux, toc)
+        toc.write_text("\\contentsline {chapter}{One}{3}\n")
+        self.assertNotEqual(first, PDFGenerator._aux_digest(aux, toc))
+
+
+class TestConvergenceLoop(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+        self.tex = self.tmp / "book.tex"
+        self.tex.write_text("\\documentclass{book}")
+        self.pdf = self.tmp / "run1.pdf"
+
+    def _run(self, fake):
+        g = _generator()
+        with patch("lib.pdf_generator.subprocess.run", fake):
+            g._run_xelatex_converging(self.tex, self.tmp, "run1", self.pdf)
+        return fake.calls
+
+    def test_trivial_aux_stops_after_one_pass(self):
+        fake = _FakeXelatex(aux_per_pass=["\\relax \n"])
+        self.assertEqual(self._run(fake), 1)
+
+    def test_reruns_until_aux_stable(self):
+        # Pass 1 writes labels, pass 2 writes the same labels again —
+        # digest matches, so the loop stops at two passes.
+        fake = _FakeXelatex(aux_per_pass=[
+            "\\newlabel{a}{{1}{3}}\n", "\\newlabel{a}{{1}{3}}\n"])
+        self.assertEqual(self._run(fake), 2)
+
+    def test_oscillating_aux_capped_at_max_passes(self):
+        # Page numbers flip every pass; the loop must still terminate.
+        fake = _FakeXelatex(aux_per_pass=[
+            f"\\newlabel{{a}}{{{{1}}{{{n}}}}}\n" for n in range(10)])
+        self.assertEqual(self._run(fake), PDFGenerator.MAX_PASSES)
+
+    def test_no_pdf_raises(self):
+        def _no_pdf(cmd, **kwargs):
+            class _Result:
+                returncode = 1
+                stdout = "! Emergency stop."
+                stderr = ""
+            return _Result()
+
+        g = _generator()
+        with patch("lib.pdf_generator.subprocess.run", _no_pdf):
+            with self.assertRaises(RuntimeError):
+                g._run_xelatex_converging(self.tex, self.tmp, "run1",
+                                          self.pdf)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""ProntoR2Client.upload_many — dispatch and result keying, with the
+per-object upload methods stubbed (the boto3 edge is exercised in
+acceptance, not unit tests)."""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.pronto_r2_client import ProntoR2Client
+
+
+def _client():
+    # __init__ builds a boto3 client from credentials; upload_many
+    # only needs the two per-object upload methods.
+    c = ProntoR2Client.__new__(ProntoR2Client)
+    c.upload_json = MagicMock(
+        side_effect=lambda key, data, content_type=None, **kw:
+            {"object_key": key, "kind": "json"})
+    c.upload_file = MagicMock(
+        side_effect=lambda key, path, content_type=None, **kw:
+            {"object_key": key, "kind": "file"})
+    return c
+
+
+class TestUploadMany(unittest.TestCase):
+    def test_dict_payload_routes_to_upload_json(self):
+        c = _client()
+        results = c.upload_many(
+            [("runs/r1/manifest.json", {"a": 1}, "application/json")])
+        self.assertEqual(results["runs/r1/manifest.json"]["kind"], "json")
+        c.upload_json.assert_called_once()
+        c.upload_file.assert_not_called()
+
+    def test_path_payload_routes_to_upload_file(self):
+        c = _client()
+        results = c.upload_many(
+            [("runs/r1/interior.pdf", "/tmp/interior.pdf",
+              "application/pdf")])
+        self.assertEqual(results["runs/r1/interior.pdf"]["kind"], "file")
+        c.upload_file.assert_called_once()
+        c.upload_json.assert_not_called()
+
+    def test_results_keyed_by_object_key(self):
+        c = _client()
+        results = c.upload_many([
+            ("runs/r1/manifest.json", {"a": 1}, "application/json"),
+            ("runs/r1/interior.pdf", "/tmp/interior.pdf",
+             "application/pdf"),
+        ])
+        self.assertEqual(
+            set(results), {"runs/r1/manifest.json", "runs/r1/interior.pdf"})
+
+    def test_failed_upload_reraises(self):
+        c = _client()
+        c.upload_file.side_effect = RuntimeError("put_object failed")
+        with self.assertRaises(RuntimeError):
+            c.upload_many(
+                [("runs/r1/interior.pdf", "/tmp/interior.pdf",
+                  "application/pdf")])
+
+
+if __name__ == "__main__":
+    unittest.main()
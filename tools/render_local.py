@@ -16,7 +16,7 @@ Usage (from repo root):
 EB Garamond OTFs on a dev machine. Production templates are untouched —
 the rewrite happens on the in-memory template string only.
 
-Requires on PATH: python 3.10+, xelatex, pandoc (PDFGenerator probes it).
+Requires on PATH: python 3.10+, xelatex (PDFGenerator probes it).
 """
 from __future__ import annotations
 